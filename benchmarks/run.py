@@ -0,0 +1,318 @@
+"""
+Benchmark suite for the model, the account screen, the splash video and
+application start-up.
+
+    python -m benchmarks.run                                  # 1k, 10k and 100k rows
+    python -m benchmarks.run --sizes 1000,1000000 --output results.json
+    python -m benchmarks.run --baseline baseline.json         # flag regressions
+
+Run from the repository root. Model benchmarks always run. The account
+screen and cold-start benchmarks need a display; when DISPLAY is unset
+an Xvfb server is started if one is installed. The splash benchmark needs
+OpenCV and Pillow. Anything that cannot run is listed under "skipped".
+
+Each model run also reports AccountData.memory_report() figures, and
+--tracemalloc attributes the allocations of the bulk load to modules.
+
+Results are written as JSON. Keep a results file as the baseline; with
+--baseline, every result that is worse than the baseline by more than
+the threshold is reported and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from benchmarks.synthetic import generate_ledger, END_MONTH
+from src.models.account import AccountData
+from src.models.memory import trace_allocations
+from src.utils.clock import FakeClock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NOW = datetime(END_MONTH[0], END_MONTH[1], 15, 12)
+SPLASH_FRAMES = 120
+SPLASH_SIZE = (400, 680)  # window size from src.constants
+
+# Runs main.main() until the first window has been drawn, then exits
+STARTUP_SCRIPT = """
+import tkinter as tk
+tk.Tk.mainloop = lambda self, n=0: (self.update(), self.destroy())
+import main
+main.main()
+"""
+
+
+def measure(func, repeat=5, number=1, setup=None):
+    """Best time per call in seconds over repeat rounds of number calls"""
+    best = float("inf")
+    for _ in range(repeat):
+        total = 0.0
+        for _ in range(number):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            func()
+            total += time.perf_counter() - start
+        best = min(best, total / number)
+    return best
+
+
+def build_ledger(rows):
+    account_data = AccountData(clock=FakeClock(NOW))
+    account_data.add_transactions(rows)
+    return account_data
+
+
+class Suite:
+    def __init__(self, sizes, seed, trace=False):
+        self.sizes = sizes
+        self.seed = seed
+        self.trace = trace
+        self.results = {}
+        self.skipped = {}
+        self.allocations = {}  # size -> [(module, bytes, blocks)] of the bulk load
+
+    def add(self, name, value, unit="s"):
+        self.results[name] = {'value': value, 'unit': unit}
+        if unit == "s":
+            shown = f"{value * 1000:10.3f} ms"
+        elif unit == "bytes":
+            shown = f"{value / 1024:10.1f} KiB"
+        else:
+            shown = f"{value:10.1f} {unit}"
+        print(f"{name:<50} {shown}", flush=True)
+
+    def skip(self, name, reason):
+        self.skipped[name] = reason
+        print(f"{name:<50} skipped: {reason}", flush=True)
+
+    def run_model(self, size, rows):
+        repeat = 1 if size >= 100000 else 3
+        self.add(f"model.add_transactions[{size}]",
+                 measure(lambda: build_ledger(rows), repeat=repeat))
+
+        if self.trace:
+            account_data, allocations = trace_allocations(lambda: build_ledger(rows))
+            self.allocations[size] = allocations
+            for module, size_diff, blocks in allocations:
+                print(f"  allocated by {module:<38} {size_diff / 1024:10.1f} KiB in {blocks} blocks")
+        else:
+            account_data = build_ledger(rows)
+        year, month = END_MONTH
+        months = len(account_data.months)
+        first = account_data.months[0]
+        clear = account_data.query_cache.clear
+        extra = iter(generate_ledger(1000, seed=self.seed + 1)[2:] * 20)
+
+        self.add(f"model.add_transaction[{size}]",
+                 measure(lambda: account_data.add_transaction(**next(extra)), number=200))
+
+        aggregates = {
+            "income": lambda: account_data.income,
+            "total_saving": lambda: account_data.total_saving,
+            "monthly_totals": lambda: account_data.monthly_totals(first, months),
+            "daily_totals": lambda: account_data.daily_totals(year),
+            "month_balances": lambda: account_data.month_balances(year, month),
+            "range_totals": lambda: account_data.range_totals(datetime(year, 1, 1), NOW),
+            "filter_transactions": lambda: account_data.filter_transactions("coffee"),
+            "sorted_transactions": lambda: account_data.sorted_transactions(year, month, "amount"),
+        }
+        for name, query in aggregates.items():
+            self.add(f"model.{name}.cold[{size}]", measure(query, setup=clear))
+        self.add(f"model.total_saving.cached[{size}]", measure(aggregates["total_saving"], number=1000))
+
+        # Memory with every aggregate cached, as after a screen refresh
+        for query in aggregates.values():
+            query()
+        report = account_data.memory_report()
+        self.add(f"memory.total[{size}]", report['total'], unit="bytes")
+        self.add(f"memory.per_transaction[{size}]", report['per_transaction'], unit="bytes")
+        for name, structure_size in report['structures'].items():
+            self.add(f"memory.{name}[{size}]", structure_size, unit="bytes")
+        return account_data
+
+    def run_screen(self, size, account_data):
+        name = f"ui.update_displays[{size}]"
+        try:
+            import tkinter as tk
+            from src.utils.theme import init_theme
+            from src.views.account import AccountScreen
+        except ImportError as e:
+            self.skip(name, str(e))
+            return
+        root = tk.Tk()
+        root.geometry("%dx%d" % SPLASH_SIZE)
+        try:
+            init_theme(root)
+            screen = AccountScreen(root, account_data)
+            root.update()
+
+            def refresh():
+                screen.update_displays()
+                root.update()
+            self.add(name, measure(refresh))
+        finally:
+            root.destroy()
+
+    def run_splash(self):
+        name = "splash.decode_fps"
+        path = os.path.join(ROOT, "assets", "gif.mp4")
+        try:
+            import cv2
+            from PIL import Image
+            from src.views.splash import SplashScreen
+        except ImportError as e:
+            self.skip(name, str(e))
+            return
+        capture = cv2.VideoCapture(path)
+        frames = 0
+        start = time.perf_counter()
+        # Same per-frame work as SplashScreen.play_video, minus the Tk update
+        while frames < SPLASH_FRAMES:
+            ok, frame = capture.read()
+            if not ok:
+                if frames == 0:
+                    break
+                capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                continue
+            image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            SplashScreen.resize_image(None, image, SPLASH_SIZE)
+            frames += 1
+        elapsed = time.perf_counter() - start
+        capture.release()
+        if frames == 0:
+            self.skip(name, f"could not decode {path}")
+        else:
+            self.add(name, frames / elapsed, unit="fps")
+
+    def run_startup(self):
+        def start():
+            subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=ROOT, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            self.add("startup.main_to_first_frame", measure(start, repeat=3))
+        except subprocess.CalledProcessError as e:
+            self.skip("startup.main_to_first_frame", f"main.py exited with {e.returncode}")
+
+    def run(self, groups):
+        ledgers = {}
+        if "model" in groups:
+            for size in self.sizes:
+                ledgers[size] = self.run_model(size, generate_ledger(size, self.seed))
+        if "splash" in groups:
+            self.run_splash()
+        if groups & {"ui", "startup"}:
+            with display() as available:
+                for size in self.sizes if "ui" in groups else ():
+                    if not available:
+                        self.skip(f"ui.update_displays[{size}]", "no display and no Xvfb")
+                        continue
+                    account_data = ledgers.get(size) or build_ledger(generate_ledger(size, self.seed))
+                    self.run_screen(size, account_data)
+                if "startup" in groups:
+                    if available:
+                        self.run_startup()
+                    else:
+                        self.skip("startup.main_to_first_frame", "no display and no Xvfb")
+
+    def to_json(self):
+        return {
+            'meta': {
+                'created': datetime.now().isoformat(timespec="seconds"),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'sizes': self.sizes,
+                'seed': self.seed,
+            },
+            'results': self.results,
+            'skipped': self.skipped,
+            'allocations': {str(size): allocations for size, allocations in self.allocations.items()},
+        }
+
+
+@contextmanager
+def display():
+    """Yield whether a display is available, starting Xvfb if needed"""
+    if os.environ.get("DISPLAY"):
+        yield True
+        return
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        yield False
+        return
+    # -displayfd makes the server pick a free display and print its number
+    server = subprocess.Popen([xvfb, "-displayfd", "1", "-screen", "0", "1024x768x24", "-nolisten", "tcp"],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    number = server.stdout.readline().strip()
+    if not number:
+        server.terminate()
+        yield False
+        return
+    os.environ["DISPLAY"] = ":" + number
+    try:
+        yield True
+    finally:
+        del os.environ["DISPLAY"]
+        server.terminate()
+        server.wait()
+
+
+def compare(results, baseline, threshold):
+    """Names of results worse than the baseline by more than threshold (a fraction)"""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None or before['unit'] != result['unit'] or not before['value']:
+            continue
+        ratio = result['value'] / before['value']
+        # Times and sizes regress upwards, rates (fps) downwards
+        if result['unit'] in ("s", "bytes"):
+            worse = ratio > 1 + threshold
+        else:
+            worse = ratio < 1 / (1 + threshold)
+        if worse:
+            regressions.append((name, before['value'], result['value'], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the webabiq benchmarks")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma separated ledger sizes (default: %(default)s)")
+    parser.add_argument("--only", default="model,ui,splash,startup",
+                        help="comma separated groups to run (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="attribute the allocations of each bulk load to modules")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown against the baseline (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    suite = Suite([int(size) for size in args.sizes.split(",")], args.seed, args.tracemalloc)
+    suite.run(set(args.only.split(",")))
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(suite.to_json(), f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)['results']
+        regressions = compare(suite.results, baseline, args.threshold)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {before:.6g} -> {after:.6g} ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Deterministic synthetic ledgers for benchmarks.
+"""
+import random
+from datetime import date, datetime
+
+END_MONTH = (2024, 12)  # generated ledgers end in this month
+ROWS_PER_MONTH = 150  # typical density; larger ledgers get more months, up to MAX_MONTHS
+MAX_MONTHS = 240
+
+# Paid descriptions with (weight, median amount, spread) for a log-normal amount
+MERCHANTS = {
+    "Groceries": (30, 45.0, 0.6),
+    "Coffee": (25, 4.5, 0.3),
+    "Lunch": (15, 12.0, 0.4),
+    "Transport": (12, 3.0, 0.5),
+    "Dining out": (8, 38.0, 0.5),
+    "Online shopping": (6, 30.0, 1.0),
+    "Pharmacy": (3, 15.0, 0.7),
+    "Utilities": (1, 90.0, 0.3),
+}
+# Income descriptions with (weight, median amount, spread)
+INCOME_SOURCES = {
+    "Freelance": (5, 400.0, 0.8),
+    "Refund": (4, 25.0, 0.9),
+    "Gift": (1, 100.0, 0.6),
+}
+SALARY = 3200.0
+RENT = 1200.0
+NOTES = ("", "", "", " - card", " - cash", " (shared)", " weekly", " #2")
+
+
+def _months(count):
+    """The (year, month) keys covered by a ledger of count rows, oldest first"""
+    total = min(MAX_MONTHS, max(12, count // ROWS_PER_MONTH))
+    year, month = END_MONTH
+    keys = []
+    for _ in range(total):
+        keys.append((year, month))
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    return keys[::-1]
+
+
+def _days_in_month(year, month):
+    following = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return (following - date(year, month, 1)).days
+
+
+def _amount(rng, median, spread):
+    return round(median * rng.lognormvariate(0, spread), 2)
+
+
+def generate_ledger(count, seed=0):
+    """
+    Return count transaction dicts (amount, category, description, date)
+    for AccountData.add_transactions. The same count and seed always give
+    the same ledger.
+
+    Every month gets a salary on the 25th and rent on the 1st; the rest is
+    day-to-day spending with weekend-heavy dates, log-normal amounts and a
+    skewed mix of merchants, plus occasional irregular income.
+    """
+    rng = random.Random(seed)
+    months = _months(count)
+    merchants = list(MERCHANTS)
+    merchant_weights = [MERCHANTS[name][0] for name in merchants]
+    sources = list(INCOME_SOURCES)
+    source_weights = [INCOME_SOURCES[name][0] for name in sources]
+
+    rows = []
+    for year, month in months:
+        if len(rows) + 2 > count:
+            break
+        rows.append({'amount': round(SALARY * rng.uniform(0.98, 1.05), 2), 'category': 'Income',
+                     'description': "Salary", 'date': datetime(year, month, 25)})
+        rows.append({'amount': RENT, 'category': 'Paid',
+                     'description': "Rent", 'date': datetime(year, month, 1)})
+
+    while len(rows) < count:
+        year, month = rng.choice(months)
+        days = _days_in_month(year, month)
+        day = rng.randint(1, days)
+        # Weekends are busier: redraw weekday dates some of the time
+        if date(year, month, day).weekday() < 5 and rng.random() < 0.3:
+            day = rng.randint(1, days)
+        if rng.random() < 0.06:
+            name = rng.choices(sources, source_weights)[0]
+            category, (_, median, spread) = 'Income', INCOME_SOURCES[name]
+        else:
+            name = rng.choices(merchants, merchant_weights)[0]
+            category, (_, median, spread) = 'Paid', MERCHANTS[name]
+        rows.append({
+            'amount': _amount(rng, median, spread),
+            'category': category,
+            'description': name + rng.choice(NOTES),
+            'date': datetime(year, month, day),
+        })
+    return rows
@@ -0,0 +1,208 @@
+"""
+Command-line interface for ledger operations, without the GUI.
+
+    python cli.py --user NAME add 12.50 Paid "Lunch" --date 2024-05-03
+    python cli.py --user NAME import statement.csv
+    python cli.py --user NAME export --from 2024-01-01 --format json > 2024.json
+    python cli.py --user NAME query --text coffee --min 3
+    python cli.py --user NAME report --year 2024
+
+Only the model and storage layers are imported (no tkinter, cv2 or PIL),
+so it starts quickly and runs on machines without a display.
+CSV files have a header row with date (YYYY-MM-DD), amount, description
+and optionally category columns; without a category, negative amounts are
+Paid and positive amounts Income.
+"""
+import argparse
+import calendar
+import csv
+import json
+import sys
+from datetime import datetime, timedelta
+from src.constants import LEDGER_DIR
+from src.models.ledgers import load_ledger
+from src.utils.validation import validate_amount
+
+CATEGORIES = ("Income", "Paid")
+FIELDS = ("id", "date", "category", "amount", "description")
+
+
+class CliError(Exception):
+    """Invalid input; reported without a traceback"""
+
+
+def parse_date(text):
+    try:
+        return datetime.strptime(text, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{text}' (YYYY-MM-DD)")
+
+
+def parse_amount(text):
+    is_valid, amount = validate_amount(text)
+    if not is_valid:
+        raise argparse.ArgumentTypeError(amount)
+    return amount
+
+
+def parse_category(text):
+    for category in CATEGORIES:
+        if text.casefold() == category.casefold():
+            return category
+    raise argparse.ArgumentTypeError(f"category must be one of {', '.join(CATEGORIES)}")
+
+
+def date_range(args):
+    """[start, end) from --from/--to, where --to is inclusive"""
+    end = args.to + timedelta(days=1) if args.to else None
+    return args.start, end
+
+
+def row_from_csv(record, line):
+    """add_transaction arguments from one CSV record"""
+    try:
+        date = parse_date((record.get("date") or "").strip())
+        amount = parse_amount((record.get("amount") or "").strip())
+        category = (record.get("category") or "").strip()
+        category = parse_category(category) if category else ("Paid" if amount < 0 else "Income")
+    except argparse.ArgumentTypeError as e:
+        raise CliError(f"line {line}: {e}")
+    description = (record.get("description") or "").strip()
+    if not description:
+        raise CliError(f"line {line}: Description is required")
+    return {'amount': abs(amount), 'category': category,
+            'description': description, 'date': date}
+
+
+def write_rows(transactions, output_format, out):
+    """Write transactions as an aligned table, CSV or JSON"""
+    rows = ({
+        'id': t['id'],
+        'date': t['date'].strftime("%Y-%m-%d"),
+        'category': t['category'],
+        'amount': f"{t['amount']:.2f}",
+        'description': t['description']
+    } for t in transactions)
+    if output_format == "csv":
+        writer = csv.DictWriter(out, fieldnames=FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    elif output_format == "json":
+        out.write(json.dumps([dict(row, amount=float(row['amount'])) for row in rows], indent=2) + "\n")
+    else:
+        for row in rows:
+            out.write(f"{row['id']:>7}  {row['date']}  {row['category']:<6} "
+                      f"{row['amount']:>12}  {row['description']}\n")
+
+
+def cmd_add(account_data, args):
+    transaction_id = account_data.add_transaction(
+        amount=args.amount,
+        category=args.category,
+        description=args.description,
+        date=args.date or account_data.clock.now()
+    )
+    account_data.save()
+    print(f"Added transaction {transaction_id}")
+
+
+def cmd_import(account_data, args):
+    with (sys.stdin if args.file == "-" else open(args.file, newline="", encoding="utf-8")) as f:
+        reader = csv.DictReader(f)
+        # Validate the whole file before adding anything
+        rows = [row_from_csv(record, line) for line, record in enumerate(reader, start=2)]
+    account_data.add_transactions(rows)
+    account_data.save()
+    print(f"Imported {len(rows)} transactions")
+
+
+def cmd_export(account_data, args):
+    start, end = date_range(args)
+    if start is None and end is None:
+        transactions = account_data.iter_transactions()
+    else:
+        transactions = account_data.range_transactions(start, end)
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            write_rows(transactions, args.format, out)
+    else:
+        write_rows(transactions, args.format, sys.stdout)
+
+
+def cmd_query(account_data, args):
+    start, end = date_range(args)
+    transactions = account_data.filter_transactions(
+        args.text, args.category, args.min, args.max, start, end)
+    write_rows(transactions, args.format, sys.stdout)
+    if args.format == "table":
+        total = sum(t['amount'] if t['category'] == 'Income' else -t['amount'] for t in transactions)
+        print(f"{len(transactions)} transactions, net {total:.2f}")
+
+
+def cmd_report(account_data, args):
+    year = args.year or account_data.clock.year
+    totals = account_data.monthly_totals((year, 1), 12)
+    print(f"{year:<10} {'Income':>12} {'Paid':>12} {'Net':>12}")
+    for month, (income, paid) in enumerate(totals, start=1):
+        print(f"{calendar.month_abbr[month]:<10} {income:>12.2f} {paid:>12.2f} {income - paid:>12.2f}")
+    income = sum(income for income, _ in totals)
+    paid = sum(paid for _, paid in totals)
+    print(f"{'Total':<10} {income:>12.2f} {paid:>12.2f} {income - paid:>12.2f}")
+    print(f"Balance over all years: {account_data.total_saving:.2f}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Webabiq ledger operations without the GUI")
+    parser.add_argument("--user", required=True, help="ledger owner, as used to log in")
+    parser.add_argument("--data-dir", default=LEDGER_DIR, help="ledger directory (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="add one transaction")
+    add.add_argument("amount", type=parse_amount)
+    add.add_argument("category", type=parse_category)
+    add.add_argument("description")
+    add.add_argument("--date", type=parse_date, help="YYYY-MM-DD (default: today)")
+    add.set_defaults(handler=cmd_add)
+
+    import_ = commands.add_parser("import", help="add every row of a CSV file as one undo step")
+    import_.add_argument("file", help="CSV file, or - for standard input")
+    import_.set_defaults(handler=cmd_import)
+
+    def add_range(command):
+        command.add_argument("--from", dest="start", type=parse_date, help="first date, YYYY-MM-DD")
+        command.add_argument("--to", type=parse_date, help="last date (inclusive), YYYY-MM-DD")
+
+    export = commands.add_parser("export", help="write transactions as CSV or JSON")
+    add_range(export)
+    export.add_argument("--format", choices=("csv", "json"), default="csv")
+    export.add_argument("--output", "-o", help="file to write (default: standard output)")
+    export.set_defaults(handler=cmd_export)
+
+    query = commands.add_parser("query", help="search transactions")
+    query.add_argument("--text", default="", help="text contained in the description")
+    query.add_argument("--category", type=parse_category)
+    query.add_argument("--min", type=parse_amount, help="smallest amount")
+    query.add_argument("--max", type=parse_amount, help="largest amount")
+    add_range(query)
+    query.add_argument("--format", choices=("table", "csv", "json"), default="table")
+    query.set_defaults(handler=cmd_query)
+
+    report = commands.add_parser("report", help="monthly income and paid totals of a year")
+    report.add_argument("--year", type=int, help="default: the current year")
+    report.set_defaults(handler=cmd_report)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    account_data = load_ledger(args.user, args.data_dir)
+    try:
+        args.handler(account_data, args)
+    except (CliError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,19 +2,30 @@
 Main application entry point.
 """
 import tkinter as tk
+from tkinter import messagebox
 import logging
 import os
+import queue
+import threading
 from src.constants import (
     CREDENTIALS,
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
-    SPLASH_DURATION
+    SPLASH_DURATION,
+    PROFILE_CAPTURE_SECONDS,
+    API_PORT
 )
 from src.utils.ui import center_window
-from src.models.account import AccountData
+from src.utils.theme import init_theme, set_font_scale, set_palette
+from src.utils.instrumentation import start_monitor
+from src.utils.profiling import registry
+from src.models.ledgers import load_ledger
+from src.services.autosave import AutosaveService
+from src.services.api import LedgerApiServer
 from src.views.splash import SplashScreen
 from src.views.login import LoginScreen
 from src.views.account import AccountScreen
+from src.views.debug_panel import DebugPanel
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -24,14 +35,21 @@ def main():
     root = tk.Tk()
     root.title("Webabiq")
     
+    # Fonts and ttk styles shared by every screen
+    init_theme(root)
+    
+    # Event-loop latency and handler timings, when WEBABIQ_INSTRUMENT is set
+    monitor = start_monitor(root)
+    
     # Create assets directory if it doesn't exist
     os.makedirs("assets", exist_ok=True)
     
     # Center the window
     center_window(root, WINDOW_WIDTH, WINDOW_HEIGHT)
     
-    # Create account data instance
-    account_data = AccountData()
+    # The logged-in user's ledger, loaded after login
+    state = {'account_data': None, 'autosave': None, 'api': None,
+             'font_scale': 1.0, 'palette': "light"}
     
     # Create splash screen
     splash = SplashScreen(root)
@@ -39,11 +57,109 @@ def main():
     def show_login():
         splash.destroy()
         login_screen = LoginScreen(root, CREDENTIALS)
-        login_screen.login_success_callback = lambda: show_account(login_screen)
+        login_screen.login_success_callback = lambda username: show_account(login_screen, username)
     
-    def show_account(login_screen):
+    def show_account(login_screen, username):
         login_screen.destroy()
-        AccountScreen(root, account_data)
+        account_screen = AccountScreen(root)
+        
+        # Load the user's ledger in the background while the screen shows placeholders
+        loaded = queue.Queue()
+        
+        def load():
+            try:
+                loaded.put(load_ledger(username))
+            except Exception as e:
+                logger.exception("Failed to load ledger for user '%s'", username)
+                loaded.put(e)
+        
+        threading.Thread(target=load, daemon=True).start()
+        
+        def check_loaded():
+            try:
+                account_data = loaded.get_nowait()
+            except queue.Empty:
+                root.after(50, check_loaded)
+                return
+            if isinstance(account_data, Exception):
+                messagebox.showerror("Error", f"Could not load your account: {account_data}")
+                return
+            state['account_data'] = account_data
+            state['autosave'] = AutosaveService(root, account_data)
+            account_screen.set_account_data(account_data)
+            
+            # Optional local JSON API for other tools on this machine
+            api_setting = os.environ.get("WEBABIQ_API", "")
+            if api_setting not in ("", "0"):
+                port = API_PORT if api_setting == "1" else int(api_setting)
+                try:
+                    state['api'] = LedgerApiServer(root, account_data, port=port).start()
+                except OSError as e:
+                    logger.error("Could not start the ledger API on port %s: %s", port, e)
+        
+        check_loaded()
+    
+    # Undo/redo of ledger changes, leaving text editing shortcuts to the widgets
+    def on_undo(event):
+        if state['account_data'] and not isinstance(event.widget, (tk.Entry, tk.Text)):
+            state['account_data'].undo()
+    
+    def on_redo(event):
+        if state['account_data'] and not isinstance(event.widget, (tk.Entry, tk.Text)):
+            state['account_data'].redo()
+    
+    root.bind("<Control-z>", on_undo)
+    root.bind("<Control-y>", on_redo)
+    
+    # Text size (Ctrl+plus / Ctrl+minus / Ctrl+0) and light/dark colours (Ctrl+Alt+D)
+    def scale_fonts(scale):
+        state['font_scale'] = min(2.0, max(0.5, scale))
+        set_font_scale(state['font_scale'])
+    
+    def toggle_palette(event):
+        state['palette'] = "dark" if state['palette'] == "light" else "light"
+        set_palette(state['palette'])
+    
+    root.bind("<Control-plus>", lambda e: scale_fonts(state['font_scale'] + 0.1))
+    root.bind("<Control-equal>", lambda e: scale_fonts(state['font_scale'] + 0.1))
+    root.bind("<Control-minus>", lambda e: scale_fonts(state['font_scale'] - 0.1))
+    root.bind("<Control-0>", lambda e: scale_fonts(1.0))
+    root.bind("<Control-Alt-d>", toggle_palette)
+    
+    # Hidden profiling hotkeys: timing report, and a cProfile capture of the next seconds
+    def on_profile_report(event):
+        logger.info("Timing report\n%s", registry.report())
+    
+    def on_profile_capture(event):
+        path = "profile.prof"
+        if registry.capture(root, PROFILE_CAPTURE_SECONDS, path,
+                            on_done=lambda text: logger.info("cProfile written to %s\n%s", path, text)):
+            logger.info("Profiling for %s seconds", PROFILE_CAPTURE_SECONDS)
+    
+    root.bind("<Control-Alt-p>", on_profile_report)
+    root.bind("<Control-Alt-P>", on_profile_capture)
+    
+    # Hidden debug panel with memory and timing reports
+    def on_debug_panel(event):
+        if state['account_data']:
+            DebugPanel(root, state['account_data'])
+    
+    root.bind("<Control-Alt-m>", on_debug_panel)
+    
+    # Write any pending changes synchronously when the window is closed
+    def on_close():
+        if state['autosave'] and not state['autosave'].flush():
+            if not messagebox.askyesno("Error", "Some changes could not be saved. Close anyway?"):
+                return
+        if state['api']:
+            state['api'].stop()
+        if state['autosave']:
+            state['autosave'].stop()
+        if monitor:
+            monitor.stop()
+        root.destroy()
+    
+    root.protocol("WM_DELETE_WINDOW", on_close)
     
     # Show login after splash duration
     root.after(SPLASH_DURATION, show_login)
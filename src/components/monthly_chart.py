@@ -0,0 +1,131 @@
+"""
+Canvas chart of monthly income/paid bars and a cumulative savings line.
+"""
+import tkinter as tk
+from src.utils.theme import COLORS, add_theme_listener, themed_config
+
+MIN_BAR_SLOT = 8  # pixels per bar group before months are downsampled
+PADDING = 10
+
+
+def minmax_downsample(values, buckets):
+    """
+    Reduce values to at most buckets groups, keeping each group's minimum
+    and maximum so peaks survive downsampling.
+    Returns a list of (min, max) pairs.
+    """
+    if len(values) <= buckets:
+        return [(value, value) for value in values]
+    size = len(values) / buckets
+    result = []
+    for i in range(buckets):
+        group = values[int(i * size):int((i + 1) * size)] or [values[-1]]
+        result.append((min(group), max(group)))
+    return result
+
+
+class MonthlyChart(tk.Canvas):
+    """
+    Income vs paid per month as bars, savings over the range as a line.
+    Canvas items are created once and moved with coords() on refresh,
+    and redraws are coalesced to one per idle cycle.
+    """
+
+    def __init__(self, parent, account_data, first_month, months=12, **kwargs):
+        kwargs.setdefault("highlightthickness", 0)
+        super().__init__(parent, **kwargs)
+        themed_config(self, bg=kwargs.get("bg", "surface"))
+        self.account_data = account_data
+        self.first_month = first_month  # (year, month) key
+        self.months = months
+        self._income_bars = []
+        self._paid_bars = []
+        self._savings_line = None
+        self._baseline = None
+        self._redraw_pending = False
+        self.bind("<Configure>", lambda e: self.request_redraw())
+        add_theme_listener(self.apply_colors)
+
+    def set_range(self, first_month, months=None):
+        self.first_month = first_month
+        if months is not None:
+            self.months = months
+        self.request_redraw()
+
+    def request_redraw(self):
+        """Schedule a redraw for the next idle cycle unless one is pending"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw)
+
+    def apply_colors(self):
+        """Recolour the existing items after a theme change"""
+        for item in self._income_bars:
+            self.itemconfigure(item, fill=COLORS["accent"])
+        for item in self._paid_bars:
+            self.itemconfigure(item, fill=COLORS["muted"])
+        if self._baseline is not None:
+            self.itemconfigure(self._baseline, fill=COLORS["grid"])
+        if self._savings_line is not None:
+            self.itemconfigure(self._savings_line, fill=COLORS["line"])
+
+    def _resize_items(self, items, count, role):
+        """Grow or shrink a list of rectangle items to count, reusing existing ones"""
+        while len(items) < count:
+            items.append(self.create_rectangle(0, 0, 0, 0, fill=COLORS[role], outline=""))
+        while len(items) > count:
+            self.delete(items.pop())
+
+    def _redraw(self):
+        self._redraw_pending = False
+        width, height = self.winfo_width(), self.winfo_height()
+        if width <= 1 or height <= 1:
+            return
+
+        totals = self.account_data.monthly_totals(self.first_month, self.months)
+        savings, running = [], 0.0
+        for income, paid in totals:
+            running += income - paid
+            savings.append(running)
+
+        slots = max(1, min(len(totals), (width - 2 * PADDING) // MIN_BAR_SLOT))
+        incomes = minmax_downsample([income for income, _ in totals], slots)
+        paids = minmax_downsample([paid for _, paid in totals], slots)
+        savings = minmax_downsample(savings, slots)
+
+        low = min(0.0, min(low for low, _ in savings))
+        high = max([0.0] + [high for _, high in incomes + paids + savings])
+        scale = (height - 2 * PADDING) / ((high - low) or 1)
+        zero_y = height - PADDING + low * scale
+
+        def y(value):
+            return zero_y - value * scale
+
+        slot_width = (width - 2 * PADDING) / slots
+        bar_width = max(1, slot_width / 2 - 1)
+        self._resize_items(self._income_bars, slots, "accent")
+        self._resize_items(self._paid_bars, slots, "muted")
+
+        points = []
+        for i in range(slots):
+            left = PADDING + i * slot_width
+            self.coords(self._income_bars[i], left, y(incomes[i][1]), left + bar_width, zero_y)
+            self.coords(self._paid_bars[i], left + bar_width, y(paids[i][1]),
+                        left + 2 * bar_width, zero_y)
+            centre = left + slot_width / 2
+            low_value, high_value = savings[i]
+            points += [centre, y(low_value)]
+            if high_value != low_value:
+                points += [centre, y(high_value)]
+
+        if self._baseline is None:
+            self._baseline = self.create_line(0, 0, 0, 0, fill=COLORS["grid"])
+        self.coords(self._baseline, PADDING, zero_y, width - PADDING, zero_y)
+
+        if len(points) < 4:
+            points += points  # a line needs at least two points
+        if self._savings_line is None:
+            self._savings_line = self.create_line(*points, fill=COLORS["line"], width=2)
+        else:
+            self.coords(self._savings_line, *points)
+        self.tag_raise(self._savings_line)
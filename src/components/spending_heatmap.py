@@ -0,0 +1,107 @@
+"""
+Calendar heatmap of daily spending, rendered to an image off the Tk thread.
+"""
+import queue
+import threading
+import tkinter as tk
+from datetime import date
+from PIL import Image, ImageDraw, ImageTk
+from src.utils.theme import COLORS, add_theme_listener, themed_config
+
+CELL = 6  # pixels per day square
+GAP = 1
+LEVEL_ROLES = ("heat_0", "heat_1", "heat_2", "heat_3", "heat_4")  # COLORS roles by spending level
+
+
+def render_heatmap(year, totals, level_colors, background):
+    """
+    Draw a week-column calendar (Monday at the top) for a year's daily
+    totals into a PIL image. Safe to call from a worker thread, so the
+    colours are passed in rather than read from the theme.
+    """
+    first_weekday = date(year, 1, 1).weekday()
+    weeks = (first_weekday + len(totals) + 6) // 7
+    image = Image.new("RGB", (weeks * (CELL + GAP), 7 * (CELL + GAP)), background)
+    draw = ImageDraw.Draw(image)
+    peak = max(totals) or 1
+    for day, total in enumerate(totals):
+        week, weekday = divmod(first_weekday + day, 7)
+        level = 0 if total <= 0 else 1 + min(3, int(total / peak * 4))
+        x, y = week * (CELL + GAP), weekday * (CELL + GAP)
+        draw.rectangle((x, y, x + CELL - 1, y + CELL - 1), fill=level_colors[level])
+    return image
+
+
+class SpendingHeatmap(tk.Label):
+    """
+    Shows one year of daily paid totals.
+    Totals come from AccountData.daily_totals; the image is drawn by a
+    worker thread and only converted to a PhotoImage on the Tk thread
+    (Tk images cannot be created elsewhere). The rendered image is reused
+    until a transaction dated in that year changes.
+    """
+
+    def __init__(self, parent, account_data, year, **kwargs):
+        super().__init__(parent, **kwargs)
+        themed_config(self, bg=kwargs.get("bg", "surface"))
+        self.account_data = account_data
+        self.year = year
+        self._shown_key = None    # (year, year version, colours) of the displayed image
+        self._pending_key = None  # key being rendered by the worker
+        self._polling = False
+        self._results = queue.Queue()
+        self._cache = {}          # year -> (key, PhotoImage)
+        add_theme_listener(self.apply_colors)
+
+    def apply_colors(self):
+        """Render again with the new colours (they are part of the image key)"""
+        self.refresh()
+
+    def set_year(self, year):
+        self.year = year
+        self.refresh()
+
+    def refresh(self):
+        """Show an up-to-date heatmap, rendering in the background if needed"""
+        level_colors = tuple(COLORS[role] for role in LEVEL_ROLES)
+        background = COLORS["surface"]
+        key = (self.year, self.account_data.year_version(self.year), level_colors + (background,))
+        if key == self._shown_key or key == self._pending_key:
+            return
+        cached = self._cache.get(self.year)
+        if cached and cached[0] == key:
+            self._pending_key = None
+            self._show(key, cached[1])
+            return
+
+        totals = self.account_data.daily_totals(self.year)
+        self._pending_key = key
+        threading.Thread(
+            target=lambda: self._results.put((key, render_heatmap(key[0], totals, level_colors, background))),
+            daemon=True
+        ).start()
+        if not self._polling:
+            self._polling = True
+            self.after(30, self._check_result)
+
+    def _check_result(self):
+        while True:
+            try:
+                key, image = self._results.get_nowait()
+            except queue.Empty:
+                break
+            # Renders superseded by a newer refresh are dropped
+            if key == self._pending_key:
+                self._pending_key = None
+                photo = ImageTk.PhotoImage(image)
+                self._cache[key[0]] = (key, photo)
+                self._show(key, photo)
+        if self._pending_key is not None:
+            self.after(30, self._check_result)
+        else:
+            self._polling = False
+
+    def _show(self, key, photo):
+        self._shown_key = key
+        self.configure(image=photo)
+        self.image = photo
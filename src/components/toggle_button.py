@@ -2,6 +2,7 @@
 Custom toggle button component.
 """
 import tkinter as tk
+from src.utils.theme import FONTS, themed_config
 
 class ToggleButton(tk.Radiobutton):
     def __init__(self, parent, text, value, variable, **kwargs):
@@ -15,26 +16,13 @@ class ToggleButton(tk.Radiobutton):
             pady=10,
             relief="flat",
             highlightthickness=0,
-            font=("Arial", 12, "bold"),
+            font=FONTS["body_bold"],
             **kwargs
         )
+        themed_config(self, activebackground="accent", activeforeground="on_accent", selectcolor="accent")
         
-        # Store variable reference and initial colors
+        # Colours come from the shared theme; only the variable is kept per button
         self._variable = variable
-        self.active_bg = "#E75480"  # Pink background for selected state
-        self.active_fg = "white"    # White text for selected state
-        self.inactive_bg = "white"  # White background for unselected state
-        self.inactive_fg = "black"  # Black text for unselected state
-        self.hover_bg = "#E75480"   # Pink background for hover state
-        
-        # Configure initial state
-        self.configure(
-            bg=self.inactive_bg,
-            fg=self.inactive_fg,
-            activebackground=self.active_bg,
-            activeforeground=self.active_fg,
-            selectcolor=self.active_bg
-        )
         
         # Bind events
         self.bind('<Enter>', self.on_hover)
@@ -47,23 +35,26 @@ class ToggleButton(tk.Radiobutton):
     def update_state(self):
         """Update button appearance based on selection state"""
         is_selected = self._variable.get() == self['value']
-        self.configure(
-            bg=self.active_bg if is_selected else self.inactive_bg,
-            fg=self.active_fg if is_selected else self.inactive_fg
+        themed_config(
+            self,
+            bg="accent" if is_selected else "surface",
+            fg="on_accent" if is_selected else "text"
         )
     
     def on_hover(self, event):
         """Handle mouse hover"""
         if self._variable.get() != self['value']:
-            self.configure(
-                bg=self.hover_bg,
-                fg=self.active_fg
+            themed_config(
+                self,
+                bg="accent",
+                fg="on_accent"
             )
     
     def on_leave(self, event):
         """Handle mouse leave"""
         if self._variable.get() != self['value']:
-            self.configure(
-                bg=self.inactive_bg,
-                fg=self.inactive_fg
+            themed_config(
+                self,
+                bg="surface",
+                fg="text"
             )
\ No newline at end of file
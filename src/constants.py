@@ -18,4 +18,38 @@ DARK_TEXT = "#333333"
 # Window settings
 WINDOW_WIDTH = 400
 WINDOW_HEIGHT = 680
-SPLASH_DURATION = 3000  # milliseconds
\ No newline at end of file
+SPLASH_DURATION = 3000  # milliseconds
+
+# Undo history
+UNDO_DEPTH = 100  # maximum number of undoable steps kept in memory
+
+# Ledger storage
+LEDGER_DIR = "data"
+MAX_LOADED_MONTHS = 24  # months of transactions kept in memory at once
+LEDGER_MEMORY_BUDGET = 64 * 1024 * 1024  # bytes, estimated
+MAX_AMOUNT = 10 ** 15  # largest transaction amount; stored as cents in 64 bits
+
+# Autosave
+AUTOSAVE_DELAY_MS = 500  # idle time before unsaved changes are written
+AUTOSAVE_MAX_CHANGES = 20  # write immediately after this many unsaved changes
+
+# Rendering
+RENDER_SLICE_MS = 8  # time budget per chunk when filling long lists
+TABLE_PAGE_SIZE = 100  # transaction rows inserted per page as the list scrolls
+FILTER_DEBOUNCE_MS = 150  # pause in typing before the filter bar is applied
+
+# Instrumentation (enabled with the WEBABIQ_INSTRUMENT environment variable)
+INSTRUMENT_PROBE_MS = 100  # interval of the event-loop latency probe
+INSTRUMENT_SLOW_MS = 50  # handlers and delays at least this long go to the slow-event log
+INSTRUMENT_REPORT_MS = 10000  # how often the rolling histogram is written
+
+# Profiling (Ctrl+Alt+P dumps the timing report, Ctrl+Alt+Shift+P captures cProfile)
+PROFILE_SAMPLES = 1000  # recent durations kept per timed function for percentiles
+PROFILE_CAPTURE_SECONDS = 10
+
+# Local JSON API (enabled with WEBABIQ_API=1, or WEBABIQ_API=<port>)
+API_HOST = "127.0.0.1"  # never exposed beyond this machine
+API_PORT = 8765
+API_POLL_MS = 20  # how often the Tk thread runs queued API requests
+API_IDLE_TIMEOUT = 30  # seconds a keep-alive connection may stay idle
+API_MAX_BODY = 16 * 1024 * 1024  # bytes
@@ -1,68 +1,1050 @@
 """
 Account data model and transaction management.
 """
-from datetime import datetime, date, timedelta
+import functools
+import math
+import threading
+import weakref
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime
+from types import MappingProxyType
+from src.constants import UNDO_DEPTH, MAX_LOADED_MONTHS, LEDGER_MEMORY_BUDGET, MAX_AMOUNT
+from src.models.binary_ledger import CATEGORIES
+from src.models.cache import QueryCache, cached_query
+from src.models.fenwick import FenwickTree
+from src.models.history import CommandLog, ADD, DELETE, UPDATE
+from src.models.memory import deep_size
+from src.utils.clock import Clock
+from src.utils.profiling import profiled
+
+# Rough in-memory cost of one transaction record (dict, strings, datetime)
+ROW_SIZE_ESTIMATE = 600
+
+
+def month_key(value):
+    """(year, month) key of a date or datetime"""
+    return value.year, value.month
+
+
+def month_bounds(key):
+    """First moment of a month and of the month after it"""
+    year, month = key
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+
+def sort_key(transaction):
+    """Ledger order: by date, then by id for transactions on the same date"""
+    return transaction['date'], transaction['id']
+
+
+def month_ordinal(key):
+    return key[0] * 12 + key[1] - 1
+
+
+def signed_amount(transaction):
+    """Effect of a transaction on the balance"""
+    if transaction['category'] == 'Income':
+        return transaction['amount']
+    if transaction['category'] == 'Paid':
+        return -transaction['amount']
+    return 0.0
+
+
+def locked(method):
+    """
+    Run a method of AccountData while holding its lock. Listeners of the
+    changes it makes run after the outermost hold is released.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._acquire()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._release()
+    return wrapper
+
+
+def filter_rows(rows, text='', category=None, min_amount=None, max_amount=None):
+    """Rows matching every given criterion; text is a case-insensitive description substring"""
+    needle = text.casefold()
+    return tuple(
+        t for t in rows
+        if (category is None or t['category'] == category)
+        and (min_amount is None or t['amount'] >= min_amount)
+        and (max_amount is None or t['amount'] <= max_amount)
+        and (not needle or needle in t['description'].casefold())
+    )
+
+
+def day_start(value):
+    """Midnight of the day of a date or datetime; transactions keep whole days"""
+    return datetime(value.year, value.month, value.day)
+
+
+def check_fields(amount=None, category=None, description=None):
+    """Raise ValueError for transaction fields that cannot be stored (None is not checked)"""
+    if amount is not None and not (math.isfinite(amount) and abs(amount) <= MAX_AMOUNT):
+        raise ValueError(f"Invalid amount: {amount}")
+    if category is not None and category not in CATEGORIES:
+        raise ValueError(f"Unknown category: {category}")
+    if description is not None and not isinstance(description, str):
+        raise ValueError("Description must be text")
+
+
+def to_cents(amount):
+    """Round an amount to whole cents, the precision the ledger stores"""
+    return round(amount, 2)
+
+
+def as_datetime(value):
+    """Promote a date to midnight so it compares with transaction datetimes"""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.combine(value, datetime.min.time())
+
+
+class MonthBucket:
+    """Running totals and rows for a single calendar month"""
+    __slots__ = ('income', 'paid', 'count', 'first_id', 'last_id',
+                 'rows', 'keys', 'days', 'dirty', 'version', 'prefix')
+
+    def __init__(self, income=0.0, paid=0.0, count=0, first_id=None, last_id=None):
+        self.income = income
+        self.paid = paid
+        self.count = count
+        # Smallest and largest id the month may hold, so lookups by id know
+        # which unloaded months to read. Deletes do not narrow the range;
+        # both are None while the month has never held a transaction.
+        self.first_id = first_id
+        self.last_id = last_id
+        # Transactions sorted by (date, id) and their sort keys, or None while
+        # the month is not loaded
+        self.rows = None
+        self.keys = None
+        # Category -> amount per day of the month (index 0 is the 1st), kept
+        # up to date with every change once the month has been loaded
+        self.days = None
+        self.dirty = False
+        self.version = 0  # ledger version of the last change to this month
+        # Running sum of signed amounts within the month at each position,
+        # built on the first balance query
+        self.prefix = None
+
+    @property
+    def total(self):
+        return self.income - self.paid
+
+    @property
+    def loaded(self):
+        return self.rows is not None
+
+    def summary(self):
+        return {'income': self.income, 'paid': self.paid, 'count': self.count}
+
+    def index_entry(self):
+        """Summary plus id range, as kept in the storage index"""
+        return dict(self.summary(), first_id=self.first_id, last_id=self.last_id)
+
+    def may_hold(self, transaction_id):
+        return self.first_id is not None and self.first_id <= transaction_id <= self.last_id
+
+    def add_id(self, transaction_id):
+        if self.first_id is None or transaction_id < self.first_id:
+            self.first_id = transaction_id
+        if self.last_id is None or transaction_id > self.last_id:
+            self.last_id = transaction_id
+
+    def set_rows(self, rows):
+        """Hold the given transactions, sorting them into ledger order"""
+        self.rows = sorted(rows, key=sort_key)
+        self.keys = [sort_key(t) for t in self.rows]
+        self.prefix = None
+        self.days = {category: [0.0] * 31 for category in CATEGORIES}
+        for t in self.rows:
+            self.add_day(t, t['amount'])
+        ids = [t['id'] for t in self.rows]
+        self.first_id = min(ids) if ids else None
+        self.last_id = max(ids) if ids else None
+
+    def add_day(self, transaction, amount):
+        days = self.days[transaction['category']]
+        day = transaction['date'].day - 1
+        days[day] = to_cents(days[day] + amount)
+
+    def unload(self):
+        """Drop the rows; the per-day sums stay valid as the month cannot change unloaded"""
+        self.rows = self.keys = self.prefix = None
+
+    def position(self, transaction):
+        """Index of a held transaction, by binary search"""
+        return bisect_left(self.keys, sort_key(transaction))
+
+    def span(self, start=None, end=None):
+        """Index range of rows with dates in [start, end)"""
+        lo = 0 if start is None else bisect_left(self.keys, (start,))
+        hi = len(self.keys) if end is None else bisect_left(self.keys, (end,))
+        return lo, max(lo, hi)
+
 
 class AccountData:
-    def __init__(self):
-        self.transactions = []
-    
+    def __init__(self, storage=None, history_depth=UNDO_DEPTH,
+                 max_loaded_months=MAX_LOADED_MONTHS, memory_budget=LEDGER_MEMORY_BUDGET,
+                 clock=None):
+        """
+        Without storage every month stays in memory. With a storage only
+        the month summaries are read up front; rows of a month are loaded
+        on first access and cold months are evicted once more than
+        max_loaded_months are loaded or their estimated size exceeds
+        memory_budget bytes. The clock decides what "this month" is.
+
+        Every public method holds a single reentrant lock while it reads or
+        changes the ledger. Listeners run on the changing thread once the
+        lock is released, and the app's listeners update Tk widgets, so
+        changes must be made on the Tk thread. Other threads read through
+        read_snapshot(), which holds the lock only while copying the loaded
+        months changed since a snapshot still in use.
+        """
+        self.storage = storage
+        self.clock = clock or Clock()
+        self.max_loaded_months = max_loaded_months
+        self.memory_budget = memory_budget
+        self._records = {}  # id -> transaction, for loaded months only (see _find)
+        self._months = {}   # (year, month) -> MonthBucket
+        self._loaded = OrderedDict()  # loaded month keys, least recently used first
+        self._loaded_rows = 0
+        self._category_totals = {}
+        self._month_nets = None  # FenwickTree of month totals by month ordinal
+        self._first_ordinal = 0
+        self._next_id = 1
+        self._version = 0  # incremented on every mutation
+        self._year_versions = {}  # year -> ledger version of its last change
+        self.history = CommandLog(history_depth)
+        self.query_cache = QueryCache()
+        self._listeners = []
+        self._pending_notify = False
+        self._lock = threading.RLock()
+        self._hold_depth = 0  # nesting of _acquire on the thread holding the lock
+        # Read-only rows shared by snapshots: FrozenMonth of each month at its
+        # current version, kept only while a live snapshot uses it
+        self._frozen = weakref.WeakValueDictionary()
+
+        if storage is not None:
+            index = storage.load_index()
+            self._next_id = index['next_id']
+            for key, summary in index['months'].items():
+                self._months[key] = MonthBucket(**summary)
+            self._category_totals['Income'] = to_cents(sum(b.income for b in self._months.values()))
+            self._category_totals['Paid'] = to_cents(sum(b.paid for b in self._months.values()))
+
+    @property
+    def transactions(self):
+        """All transactions in (date, id) order (reads unloaded months from storage)"""
+        return list(self.iter_transactions())
+
+    def iter_transactions(self):
+        """
+        Iterate over all transactions month by month.
+        Unloaded months are read from storage without entering the cache,
+        so a full scan does not evict the months the screens are using.
+        """
+        with self._lock:
+            keys = sorted(self._months)
+        for key in keys:
+            with self._lock:
+                bucket = self._months[key]
+                rows = list(bucket.rows) if bucket.loaded else None
+                stored = rows is None and bucket.count
+            if rows is not None:
+                yield from rows
+            elif stored:
+                yield from self.storage.load_month(key)
+
+    @property
+    @locked
+    def months(self):
+        """Keys of all months that have transactions, oldest first"""
+        return sorted(key for key, bucket in self._months.items() if bucket.count)
+
+    @locked
+    def month_summary(self, year, month):
+        """Precomputed totals of a month, available without loading its rows"""
+        bucket = self._months.get((year, month))
+        return bucket.summary() if bucket else MonthBucket().summary()
+
+    def year_version(self, year):
+        """Changes only when a transaction dated in the given year changes"""
+        return self._year_versions.get(year, 0)
+
+    @locked
+    @cached_query
+    def daily_totals(self, year, category='Paid'):
+        """
+        Amount per day of a year for one category, as a tuple indexed by
+        day of the year (0 is January 1st). Months loaded at some point
+        keep per-day sums up to date with each change, so only months never
+        loaded are summed, over their mapped storage files.
+        """
+        first = date(year, 1, 1)
+        totals = [0.0] * ((date(year + 1, 1, 1) - first).days)
+        for month in range(1, 13):
+            bucket = self._months.get((year, month))
+            if bucket is None or not bucket.count:
+                continue
+            if bucket.days is not None:
+                offset = (date(year, month, 1) - first).days
+                for day, total in enumerate(bucket.days[category]):
+                    if total:
+                        totals[offset + day] = total
+            else:
+                for day, total in self.storage.daily_totals((year, month), category).items():
+                    totals[(day - first).days] += total
+        return tuple(totals)
+
+    @locked
+    @cached_query
+    def monthly_totals(self, first, count):
+        """
+        (income, paid) per month for count consecutive months starting at
+        the (year, month) key first, from the month summaries
+        """
+        ordinal = month_ordinal(first)
+        totals = []
+        for offset in range(count):
+            year, month = divmod(ordinal + offset, 12)
+            bucket = self._months.get((year, month + 1))
+            totals.append((bucket.income, bucket.paid) if bucket else (0.0, 0.0))
+        return tuple(totals)
+
+    @property
+    def generation(self):
+        """Changes whenever the ledger is mutated; used to invalidate cached queries"""
+        return self._version
+
+    @locked
+    @cached_query
+    def month_transactions(self, year, month):
+        """Transactions of a month as a tuple, loading the month on demand"""
+        return tuple(self._month((year, month)).rows)
+
+    def _months_between(self, start, end):
+        """Keys and bounds of the months with transactions overlapping [start, end)"""
+        for key in self.months:
+            month_start, month_end = month_bounds(key)
+            if (end is None or month_start < end) and (start is None or month_end > start):
+                yield key, month_start, month_end
+
+    @locked
+    def range_totals(self, start=None, end=None):
+        """
+        Income and paid totals for dates in [start, end).
+        Whole months use their summaries; partially covered months that are
+        not loaded are scanned in the mapped storage file.
+        """
+        start, end = as_datetime(start), as_datetime(end)
+        totals = {'Income': 0.0, 'Paid': 0.0}
+        for key, month_start, month_end in self._months_between(start, end):
+            bucket = self._months[key]
+            if (start is None or start <= month_start) and (end is None or month_end <= end):
+                month_totals = {'Income': bucket.income, 'Paid': bucket.paid}
+            elif bucket.loaded:
+                month_totals = {}
+                lo, hi = bucket.span(start, end)
+                for t in bucket.rows[lo:hi]:
+                    month_totals[t['category']] = month_totals.get(t['category'], 0.0) + t['amount']
+            else:
+                month_totals = self.storage.month_totals(key, start, end)
+            for category in totals:
+                totals[category] = to_cents(totals[category] + month_totals.get(category, 0.0))
+        return totals
+
+    @locked
+    @cached_query
+    def range_transactions(self, start=None, end=None):
+        """
+        Transactions with dates in [start, end), month by month, as a tuple.
+        Unloaded months decode only the matching slice of their file.
+        """
+        start, end = as_datetime(start), as_datetime(end)
+        result = []
+        for key, _, _ in self._months_between(start, end):
+            bucket = self._months[key]
+            if bucket.loaded:
+                lo, hi = bucket.span(start, end)
+                result.extend(bucket.rows[lo:hi])
+            else:
+                result.extend(self.storage.load_month(key, start, end))
+        return tuple(result)
+
+    @locked
+    def add_listener(self, callback):
+        """Register a callback invoked after each change to the ledger"""
+        self._listeners.append(callback)
+
+    @locked
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _acquire(self):
+        self._lock.acquire()
+        self._hold_depth += 1
+
+    def _release(self):
+        """Release the lock, then run the listeners if this was the outermost hold and anything changed"""
+        self._hold_depth -= 1
+        listeners = ()
+        if not self._hold_depth and self._pending_notify:
+            self._pending_notify = False
+            listeners = list(self._listeners)
+        self._lock.release()
+        for callback in listeners:
+            callback()
+
+    def _notify(self):
+        """Have the listeners run once the lock is released"""
+        self._pending_notify = True
+
+    @contextmanager
+    def deferred_notifications(self):
+        """
+        Notify listeners once after the block instead of after each change.
+        Undo steps are unaffected. The lock is held for the whole block.
+        """
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group mutations into one undo step and one change notification.
+        The lock is held for the whole block, so other threads never see
+        a half-applied batch.
+        """
+        with self.deferred_notifications(), self.history.batch():
+            yield
+
+    @locked
     def add_transaction(self, amount: float, category: str, description: str, date=None):
-        """Add a new transaction"""
-        self.transactions.append({
-            'amount': amount,
+        """
+        Add a new transaction and return its id. The amount is rounded to
+        cents and the date (default today) is kept as a whole day, as they
+        are stored. Raises ValueError for a non-finite or too large amount
+        or an unknown category.
+        """
+        check_fields(amount, category, description)
+        transaction = {
+            'id': self._next_id,
+            'amount': to_cents(amount),
             'category': category,
             'description': description,
-            'date': date or datetime.now()
-        })
-    
+            'date': day_start(date or self.clock.today)
+        }
+        self._next_id += 1
+        self._insert(transaction)
+        self.history.record((ADD, transaction))
+        self._notify()
+        return transaction['id']
+
+    @locked
+    def add_transactions(self, rows):
+        """Add many transactions as a single undo step, returning their ids"""
+        with self.batch():
+            return [self.add_transaction(**row) for row in rows]
+
+    @locked
+    def get_transaction(self, transaction_id):
+        """Get a transaction by id, loading its month if needed"""
+        return self._find(transaction_id)
+
+    def _find(self, transaction_id):
+        """
+        A transaction by id. Loaded months are looked up in the id index;
+        otherwise the unloaded months whose id range covers the id are
+        loaded until it is found. Raises KeyError for an unknown id.
+        """
+        transaction = self._records.get(transaction_id)
+        if transaction is not None:
+            return transaction
+        for key, bucket in list(self._months.items()):
+            if bucket.count and not bucket.loaded and bucket.may_hold(transaction_id):
+                self._month(key)
+                if transaction_id in self._records:
+                    return self._records[transaction_id]
+        raise KeyError(transaction_id)
+
+    @locked
+    def update_transaction(self, transaction_id, amount=None, category=None,
+                           description=None, date=None):
+        """Update fields of an existing transaction in place; see add_transaction"""
+        check_fields(amount, category, description)
+        transaction = self._find(transaction_id)
+        if amount is not None:
+            amount = to_cents(amount)
+        if date is not None:
+            date = day_start(date)
+        fields = {'amount': amount, 'category': category,
+                  'description': description, 'date': date}
+        changes = {name: (transaction[name], value) for name, value in fields.items()
+                   if value is not None and value != transaction[name]}
+        if changes:
+            key = month_key(transaction['date'])
+            self._apply_changes(transaction, changes, 1)
+            self.history.record((UPDATE, transaction_id, key, changes))
+            self._notify()
+        return transaction
+
+    @locked
+    def delete_transaction(self, transaction_id):
+        """Delete a transaction and return the removed record"""
+        transaction = self._find(transaction_id)
+        self._remove(transaction)
+        self.history.record((DELETE, transaction))
+        self._notify()
+        return transaction
+
+    @locked
+    def undo(self):
+        """Revert the most recent step. Returns False if there is nothing to undo"""
+        if not self.history.can_undo:
+            return False
+        for delta in reversed(self.history.pop_undo()):
+            self._apply_delta(delta, inverse=True)
+        self._notify()
+        return True
+
+    @locked
+    def redo(self):
+        """Reapply the most recently undone step. Returns False if there is none"""
+        if not self.history.can_redo:
+            return False
+        for delta in self.history.pop_redo():
+            self._apply_delta(delta, inverse=False)
+        self._notify()
+        return True
+
+    def _apply_delta(self, delta, inverse):
+        kind = delta[0]
+        if kind == UPDATE:
+            _, transaction_id, key, changes = delta
+            if inverse and 'date' in changes:
+                key = month_key(changes['date'][1])
+            # The month may have been evicted since the delta was recorded
+            self._month(key)
+            self._apply_changes(self._records[transaction_id], changes, 0 if inverse else 1)
+        elif (kind == ADD) != inverse:
+            self._insert(delta[1])
+        else:
+            self._month(month_key(delta[1]['date']))
+            self._remove(self._records[delta[1]['id']])
+
+    def _apply_changes(self, transaction, changes, side):
+        """Set each changed field to its old (side 0) or new (side 1) value"""
+        self._remove(transaction)
+        for name, values in changes.items():
+            transaction[name] = values[side]
+        self._insert(transaction)
+
+    def _insert(self, transaction):
+        """Apply a transaction to the running totals and month buckets"""
+        amount = transaction['amount']
+        category = transaction['category']
+        self._category_totals[category] = to_cents(self._category_totals.get(category, 0.0) + amount)
+
+        key = month_key(transaction['date'])
+        bucket = self._month(key)
+        position = bisect_left(bucket.keys, sort_key(transaction))
+        bucket.keys.insert(position, sort_key(transaction))
+        bucket.rows.insert(position, transaction)
+        self._add_balance(key, bucket, position, signed_amount(transaction))
+        bucket.count += 1
+        bucket.add_id(transaction['id'])
+        bucket.add_day(transaction, amount)
+        self._version += 1
+        self._year_versions[key[0]] = self._version
+        bucket.version = self._version
+        bucket.dirty = True
+        if category == 'Income':
+            bucket.income = to_cents(bucket.income + amount)
+        elif category == 'Paid':
+            bucket.paid = to_cents(bucket.paid + amount)
+        self._records[transaction['id']] = transaction
+        self._loaded_rows += 1
+
+    def _remove(self, transaction):
+        """Reverse the effect of _insert for a transaction"""
+        amount = transaction['amount']
+        category = transaction['category']
+        self._category_totals[category] = to_cents(self._category_totals[category] - amount)
+
+        key = month_key(transaction['date'])
+        bucket = self._months[key]
+        position = bucket.position(transaction)
+        del bucket.keys[position]
+        del bucket.rows[position]
+        self._add_balance(key, bucket, position, -signed_amount(transaction))
+        bucket.count -= 1
+        bucket.add_day(transaction, -amount)
+        self._version += 1
+        self._year_versions[key[0]] = self._version
+        bucket.version = self._version
+        bucket.dirty = True
+        if category == 'Income':
+            bucket.income = to_cents(bucket.income - amount)
+        elif category == 'Paid':
+            bucket.paid = to_cents(bucket.paid - amount)
+        del self._records[transaction['id']]
+        self._loaded_rows -= 1
+
+    def _add_balance(self, key, bucket, position, amount):
+        """
+        Apply a balance change of amount at a row position that was just
+        inserted or removed. Must run before the bucket totals are updated.
+        """
+        if self._month_nets is not None:
+            index = month_ordinal(key) - self._first_ordinal
+            if 0 <= index < len(self._month_nets):
+                self._month_nets.add(index, amount)
+            else:
+                self._month_nets = None  # rebuilt with a wider range when next needed
+
+        prefix = bucket.prefix
+        if prefix is not None:
+            if len(prefix) < len(bucket.rows):
+                prefix.insert(position, prefix[position - 1] if position else 0.0)
+            elif len(prefix) > len(bucket.rows):
+                del prefix[position]
+            # Shift the running sums of every later row in the month
+            for i in range(position, len(prefix)):
+                prefix[i] += amount
+
+    def _balance_before(self, key):
+        """Balance carried into a month from all earlier months"""
+        if self._month_nets is None:
+            ordinals = [month_ordinal(k) for k in self._months] or [month_ordinal(key)]
+            self._first_ordinal = min(min(ordinals), month_ordinal(key)) - 12
+            size = max(max(ordinals), month_ordinal(key)) + 24 - self._first_ordinal
+            values = [0.0] * size
+            for k, bucket in self._months.items():
+                values[month_ordinal(k) - self._first_ordinal] += bucket.total
+            self._month_nets = FenwickTree.from_values(values)
+        return self._month_nets.prefix(month_ordinal(key) - self._first_ordinal)
+
+    @locked
+    def month_balances(self, year, month):
+        """Running balance after each transaction of a month, keyed by id"""
+        key = (year, month)
+        bucket = self._month(key)
+        if bucket.prefix is None:
+            bucket.prefix = []
+            running = 0.0
+            for t in bucket.rows:
+                running += signed_amount(t)
+                bucket.prefix.append(running)
+        carried = self._balance_before(key)
+        return {t['id']: carried + running for t, running in zip(bucket.rows, bucket.prefix)}
+
+    @locked
+    @cached_query
+    def filter_transactions(self, text='', category=None, min_amount=None, max_amount=None,
+                            start=None, end=None):
+        """
+        Transactions matching every given criterion, in date order, as a tuple.
+        The date range narrows the scan through the month index first, and
+        the result for a shorter search text is narrowed when it is cached
+        (the usual case while typing).
+        """
+        rows = None
+        for length in range(len(text) - 1, 0, -1):
+            key = self.filter_transactions.key(text[:length], category, min_amount, max_amount, start, end)
+            rows = self.query_cache.peek(key, self.generation)
+            if rows is not None:
+                break
+        if rows is None:
+            rows = self.range_transactions(start, end)
+        return filter_rows(rows, text, category, min_amount, max_amount)
+
+    @locked
+    @cached_query
+    def sorted_transactions(self, year, month, column='date'):
+        """
+        Transactions of a month in ascending order of a column: 'date'
+        (the stored order), 'amount' (signed), 'balance' or 'description'.
+        Other orders are computed once per mutation and shared by callers.
+        """
+        return self.sort_rows(self.month_transactions(year, month), column)
+
+    @locked
+    def sort_rows(self, rows, column):
+        """Reorder date-ordered rows by a column; see sorted_transactions"""
+        if column == 'date':
+            return rows
+        if column == 'amount':
+            key = signed_amount
+        elif column == 'balance':
+            balances = {}
+            for month in {month_key(t['date']) for t in rows}:
+                balances.update(self.month_balances(*month))
+            key = lambda t: balances[t['id']]
+        elif column == 'description':
+            key = lambda t: t['description'].casefold()
+        else:
+            raise ValueError(f"Unknown sort column: {column}")
+        return tuple(sorted(rows, key=key))
+
+    def _month(self, key):
+        """Get the bucket for a month, loading its rows if needed"""
+        bucket = self._months.get(key)
+        if bucket is None:
+            bucket = self._months[key] = MonthBucket()
+            bucket.set_rows([])
+        elif not bucket.loaded:
+            bucket.set_rows(self.storage.load_month(key))
+            self._records.update((t['id'], t) for t in bucket.rows)
+            self._loaded_rows += len(bucket.rows)
+            # Snapshots taken while the month was unloaded keep this state,
+            # which the caller may be about to change
+            frozen = self._frozen.get(key)
+            if frozen is not None and frozen.version == bucket.version and frozen.rows is None:
+                frozen.fill(bucket.rows)
+
+        if self.storage is not None:
+            self._loaded[key] = None
+            self._loaded.move_to_end(key)
+            self._evict(keep=key)
+        return bucket
+
+    def _evict(self, keep):
+        """Unload least recently used months until within the configured limits"""
+        current = self.clock.month_key
+        for key in list(self._loaded):
+            if (len(self._loaded) <= self.max_loaded_months
+                    and self._loaded_rows * ROW_SIZE_ESTIMATE <= self.memory_budget):
+                break
+            if key in (keep, current):
+                continue
+            bucket = self._months[key]
+            if bucket.dirty:
+                # Staged rows are served by load_month and written with the
+                # next snapshot, so evicting never writes on this thread
+                self.storage.stage({'months': {key: (bucket.version, [dict(t) for t in bucket.rows])}})
+            for transaction in bucket.rows:
+                del self._records[transaction['id']]
+            self._loaded_rows -= len(bucket.rows)
+            bucket.unload()
+            del self._loaded[key]
+
+    def _summaries(self):
+        return {key: bucket.index_entry() for key, bucket in self._months.items() if bucket.count}
+
+    @property
+    @locked
+    def dirty(self):
+        """Whether any month has changes not yet handed to storage"""
+        return any(bucket.dirty for bucket in self._months.values())
+
+    @locked
+    def snapshot(self):
+        """
+        Copy the changed months and the summary index for writing, stage
+        them with the storage and mark them clean. Returns None when there
+        is nothing to save.
+        The copy is consistent and independent of later mutations, so it
+        can be written from another thread with LedgerStorage.write_snapshot.
+        If the write fails, pass the snapshot to mark_unsaved so the next
+        snapshot includes its months again.
+        """
+        months = {}
+        for key, bucket in self._months.items():
+            if bucket.dirty:
+                # Changed months evicted since the last snapshot were staged
+                rows = [dict(t) for t in bucket.rows] if bucket.loaded else self.storage.load_month(key)
+                months[key] = (bucket.version, rows)
+                bucket.dirty = False
+        if not months:
+            return None
+        snapshot = {
+            'months': months,
+            'index': (self._version, self._next_id, self._summaries())
+        }
+        if self.storage is not None:
+            self.storage.stage(snapshot)
+        return snapshot
+
+    @locked
+    def mark_unsaved(self, snapshot):
+        """Mark the months of a snapshot that could not be written as changed again"""
+        for key, (version, _) in snapshot['months'].items():
+            bucket = self._months.get(key)
+            # A later change is already dirty or in a newer snapshot
+            if bucket is not None and bucket.version <= version:
+                bucket.dirty = True
+
+    @locked
+    def save(self):
+        """Write changed months and the summary index to storage"""
+        if self.storage is None:
+            return
+        snapshot = self.snapshot()
+        if snapshot:
+            try:
+                self.storage.write_snapshot(snapshot)
+            except Exception:
+                self.mark_unsaved(snapshot)
+                raise
+
     @property
+    @profiled()
     def today_date(self):
         """Get formatted current date"""
-        return datetime.now().strftime("%B %d, %Y")
-    
+        return self.clock.today_text
+
     @property
+    @profiled()
+    @locked
+    @cached_query
     def income(self):
         """Calculate total income"""
-        return sum(t['amount'] for t in self.transactions 
-                  if t['category'] == 'Income')
-    
+        return self._category_totals.get('Income', 0.0)
+
     @property
+    @profiled()
+    @locked
+    @cached_query
     def paid(self):
         """Calculate total paid amount"""
-        return sum(t['amount'] for t in self.transactions 
-                  if t['category'] == 'Paid')
-    
+        return self._category_totals.get('Paid', 0.0)
+
     @property
+    @profiled()
+    @locked
+    @cached_query
     def total_saving(self):
         """Calculate total savings"""
         return self.income - self.paid
-    
+
     @property
+    @profiled()
     def monthly_range(self):
         """Get current month range"""
-        today = date.today()
-        first_day = date(today.year, today.month, 1)
-        if today.month == 12:
-            next_month = date(today.year + 1, 1, 1)
-        else:
-            next_month = date(today.year, today.month + 1, 1)
-        last_day = (next_month - timedelta(days=1)).day
-        return f"{today.month}/1 - {today.month}/{last_day}"
-    
+        return self.clock.month_range_text
+
     @property
+    @profiled()
     def monthly_transactions(self):
         """Get transactions for current month"""
-        current_month = datetime.now().month
-        current_year = datetime.now().year
-        return [t for t in self.transactions 
-                if t['date'].month == current_month 
-                and t['date'].year == current_year]
-    
+        return self.month_transactions(*self.clock.month_key)
+
     @property
+    @profiled()
+    @locked
     def monthly_total(self):
         """Calculate total for current month"""
-        monthly = self.monthly_transactions
-        income = sum(t['amount'] for t in monthly if t['category'] == 'Income')
-        paid = sum(t['amount'] for t in monthly if t['category'] == 'Paid')
-        return income - paid
\ No newline at end of file
+        return self.month_total(*self.clock.month_key)
+
+    @locked
+    @cached_query
+    def month_total(self, year, month):
+        """Calculate income minus paid for a month"""
+        bucket = self._months.get((year, month))
+        return bucket.total if bucket else 0.0
+
+    @property
+    def cache_stats(self):
+        """Query cache hit/miss counters, for tuning"""
+        return self.query_cache.stats
+
+    @locked
+    def memory_report(self):
+        """
+        Estimated bytes held by each in-memory structure, walking the
+        objects they reference. Shared objects are counted once, under the
+        first structure listed: a record appears under 'records' and the
+        month rows only add their lists and sort keys.
+        """
+        roots = {
+            'records': self._records,
+            'months': (self._months, self._loaded),
+            'balances': self._month_nets._tree if self._month_nets else (),
+            'totals': (self._category_totals, self._year_versions),
+            'history': (self.history._undo, self.history._redo),
+            'query_cache': self.query_cache._entries,
+        }
+        # roots keeps the wrapper tuples alive so their ids stay unique in seen
+        seen = set()
+        structures = {name: deep_size(root, seen) for name, root in roots.items()}
+        total = sum(structures.values())
+        count = len(self._records)
+        return {
+            'transactions': count,
+            'loaded_months': len(self._loaded),
+            'structures': structures,
+            'total': total,
+            'per_transaction': total / count if count else 0.0,
+        }
+
+    @locked
+    def read_snapshot(self):
+        """
+        An immutable, consistent view of the ledger for reading from any
+        thread (see LedgerSnapshot). Unlike snapshot(), nothing is staged
+        for saving. Months unchanged since a snapshot that is still alive
+        share its read-only rows, so only the other loaded months are
+        copied while the lock is held; unloaded months are read later.
+        """
+        months = {}
+        for key, bucket in self._months.items():
+            if not bucket.count:
+                continue
+            frozen = self._frozen.get(key)
+            if frozen is None or frozen.version != bucket.version:
+                frozen = self._frozen[key] = FrozenMonth(key, bucket.version, bucket.rows)
+            months[key] = (bucket.summary(), frozen, (bucket.first_id, bucket.last_id))
+        return LedgerSnapshot(self._version, months, dict(self._category_totals),
+                              self._read_frozen, self.clock.month_key)
+
+    def _read_frozen(self, frozen):
+        """
+        Fill a FrozenMonth of a month that was unloaded when it was frozen.
+        Storage is read without the lock: the month cannot change on disk
+        before it is loaded, and loading it (under the lock) fills the
+        FrozenMonth first, in which case the rows read here are dropped.
+        """
+        with self._lock:
+            if frozen.rows is not None:
+                return
+        rows = self.storage.load_month(frozen.key)
+        with self._lock:
+            if frozen.rows is None:
+                frozen.fill(rows)
+
+
+class FrozenMonth:
+    """Read-only rows of a month at one ledger version; rows is None until read"""
+    __slots__ = ('key', 'version', 'rows', 'ids', '__weakref__')
+
+    def __init__(self, key, version, rows=None):
+        self.key = key
+        self.version = version
+        self.rows = self.ids = None
+        if rows is not None:
+            self.fill(rows)
+
+    def fill(self, rows):
+        self.rows = tuple(MappingProxyType(dict(t)) for t in rows)
+        self.ids = {t['id']: t for t in self.rows}
+
+
+class LedgerSnapshot:
+    """
+    Read-only view of an AccountData at one ledger version.
+    Safe to share between threads and never blocks writers. Rows are
+    read-only mappings. Months that were not in memory when the snapshot
+    was taken are read from storage on first use; if the ledger loads such
+    a month first (to change it), it keeps a copy of the month as it was,
+    so every month shows its state at the snapshot's version.
+    """
+
+    def __init__(self, version, months, category_totals, read, current_month):
+        self.version = version
+        self.current_month = current_month  # (year, month) of "this month" when taken
+        self._months = months  # (year, month) -> (summary, FrozenMonth, (first id, last id))
+        self._category_totals = category_totals
+        self._read = read  # fills a FrozenMonth that has not been read yet
+
+    @property
+    def months(self):
+        """Keys of all months that have transactions, oldest first"""
+        return sorted(self._months)
+
+    def month_summary(self, year, month):
+        entry = self._months.get((year, month))
+        return entry[0] if entry else MonthBucket().summary()
+
+    def month_total(self, year, month):
+        """Income minus paid for a month"""
+        summary = self.month_summary(year, month)
+        return summary['income'] - summary['paid']
+
+    def monthly_totals(self, first, count):
+        """(income, paid) per month for count consecutive months from the key first"""
+        ordinal = month_ordinal(first)
+        totals = []
+        for offset in range(count):
+            year, month = divmod(ordinal + offset, 12)
+            summary = self.month_summary(year, month + 1)
+            totals.append((summary['income'], summary['paid']))
+        return tuple(totals)
+
+    @property
+    def income(self):
+        return self._category_totals.get('Income', 0.0)
+
+    @property
+    def paid(self):
+        return self._category_totals.get('Paid', 0.0)
+
+    @property
+    def total_saving(self):
+        return self.income - self.paid
+
+    @property
+    def monthly_total(self):
+        return self.month_total(*self.current_month)
+
+    def month_transactions(self, year, month):
+        """Transactions of a month in (date, id) order, as a tuple"""
+        entry = self._months.get((year, month))
+        if entry is None:
+            return ()
+        frozen = entry[1]
+        if frozen.rows is None:
+            self._read(frozen)
+        return frozen.rows
+
+    def iter_transactions(self):
+        for key in self.months:
+            yield from self.month_transactions(*key)
+
+    def range_transactions(self, start=None, end=None):
+        """Transactions with dates in [start, end), as a tuple"""
+        start, end = as_datetime(start), as_datetime(end)
+        result = []
+        for key in self.months:
+            month_start, month_end = month_bounds(key)
+            if (end is None or month_start < end) and (start is None or month_end > start):
+                result.extend(t for t in self.month_transactions(*key)
+                              if (start is None or t['date'] >= start)
+                              and (end is None or t['date'] < end))
+        return tuple(result)
+
+    def filter_transactions(self, text='', category=None, min_amount=None, max_amount=None,
+                            start=None, end=None):
+        """Transactions matching every given criterion, in date order, as a tuple"""
+        return filter_rows(self.range_transactions(start, end), text, category, min_amount, max_amount)
+
+    def get_transaction(self, transaction_id):
+        """
+        A transaction by id; KeyError if there is none. Months not read yet
+        are read only if their id range covers the id.
+        """
+        unread = []
+        for _, frozen, (first_id, last_id) in self._months.values():
+            if frozen.ids is not None:
+                if transaction_id in frozen.ids:
+                    return frozen.ids[transaction_id]
+            elif first_id <= transaction_id <= last_id:
+                unread.append(frozen)
+        for frozen in unread:
+            if frozen.rows is None:
+                self._read(frozen)
+            if transaction_id in frozen.ids:
+                return frozen.ids[transaction_id]
+        raise KeyError(transaction_id)
@@ -0,0 +1,186 @@
+"""
+Compact binary ledger format read through mmap.
+
+Layout (little endian):
+    header   magic b"WBLG", format version (u16), record size (u16),
+             record count (u32), reserved (u32)
+    records  fixed-width, sorted by (day, id):
+             day (i32, days since 1970-01-01), id (u32), amount in cents (i64),
+             description offset into the heap (u32), category code (u8), padding
+    heap     descriptions as u32 byte length followed by UTF-8 bytes
+"""
+import mmap
+import os
+import struct
+from datetime import date, datetime, timedelta
+
+try:
+    import numpy as np
+except ImportError:  # numpy comes with opencv; scans fall back to struct without it
+    np = None
+
+MAGIC = b"WBLG"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+RECORD = struct.Struct("<iIqIB3x")
+LENGTH = struct.Struct("<I")
+EPOCH = date(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+# Category codes; the position in this tuple is the stored code
+CATEGORIES = ("Income", "Paid")
+CATEGORY_CODES = {name: code for code, name in enumerate(CATEGORIES)}
+
+if np is not None:
+    RECORD_DTYPE = np.dtype({
+        'names': ['day', 'id', 'cents', 'description', 'category'],
+        'formats': ['<i4', '<u4', '<i8', '<u4', 'u1'],
+        'offsets': [0, 4, 8, 16, 20],
+        'itemsize': RECORD.size
+    })
+
+
+def epoch_day(value):
+    """Days since 1970-01-01 of a date or datetime"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.toordinal() - EPOCH_ORDINAL
+
+
+def from_epoch_day(day):
+    return datetime.combine(EPOCH + timedelta(days=day), datetime.min.time())
+
+
+def encode(transactions):
+    """
+    Serialize transactions to the binary format.
+    Dates are stored as whole days and amounts as cents.
+    """
+    heap = bytearray()
+    records = []
+    for t in sorted(transactions, key=lambda t: (epoch_day(t['date']), t['id'])):
+        text = t['description'].encode("utf-8")
+        records.append(RECORD.pack(
+            epoch_day(t['date']),
+            t['id'],
+            round(t['amount'] * 100),
+            len(heap),
+            CATEGORY_CODES[t['category']]
+        ))
+        heap += LENGTH.pack(len(text)) + text
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, len(records), 0)
+    return header + b"".join(records) + bytes(heap)
+
+
+class MappedLedger:
+    """
+    Read-only view of a binary ledger file.
+    Range lookups and totals work on the mapped bytes; only rows() builds
+    transaction dicts. Close it (or use it as a context manager) promptly
+    so the file can be replaced.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._buffer = memoryview(self._map) if self._map is not None else memoryview(b"")
+        self.count = 0
+        if size:
+            magic, version, record_size, self.count, _ = HEADER.unpack_from(self._buffer)
+            if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD.size:
+                self.close()
+                raise ValueError(f"Not a ledger file: {path}")
+        self._heap_start = HEADER.size + self.count * RECORD.size
+        self._array = None
+        if np is not None:
+            self._array = np.frombuffer(self._buffer, dtype=RECORD_DTYPE,
+                                        count=self.count, offset=HEADER.size)
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._array = None
+        self._buffer.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def _day_at(self, index):
+        return struct.unpack_from("<i", self._buffer, HEADER.size + index * RECORD.size)[0]
+
+    def _bisect(self, day):
+        """Index of the first record on or after day"""
+        if self._array is not None:
+            return int(np.searchsorted(self._array['day'], day, side="left"))
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._day_at(mid) < day:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def span(self, start=None, end=None):
+        """Record index range (lo, hi) of dates in [start, end)"""
+        lo = 0 if start is None else self._bisect(epoch_day(start))
+        hi = self.count if end is None else self._bisect(epoch_day(end))
+        return lo, max(lo, hi)
+
+    def totals(self, start=None, end=None):
+        """Amount totals per category for dates in [start, end)"""
+        lo, hi = self.span(start, end)
+        cents = [0] * len(CATEGORIES)
+        if self._array is not None:
+            rows = self._array[lo:hi]
+            sums = np.bincount(rows['category'], weights=rows['cents'],
+                               minlength=len(CATEGORIES))
+            cents = [int(round(value)) for value in sums]
+        else:
+            section = self._buffer[HEADER.size + lo * RECORD.size:HEADER.size + hi * RECORD.size]
+            for _, _, amount, _, category in RECORD.iter_unpack(section):
+                cents[category] += amount
+        return {name: cents[code] / 100 for code, name in enumerate(CATEGORIES)}
+
+    def daily_totals(self, category):
+        """Amount per epoch day for one category, as a dict day -> total"""
+        code = CATEGORY_CODES[category]
+        if self._array is not None:
+            rows = self._array[self._array['category'] == code]
+            days, positions = np.unique(rows['day'], return_inverse=True)
+            sums = np.bincount(positions, weights=rows['cents'], minlength=len(days))
+            return {int(day): total / 100 for day, total in zip(days, sums)}
+        totals = {}
+        section = self._buffer[HEADER.size:self._heap_start]
+        for day, _, amount, _, row_code in RECORD.iter_unpack(section):
+            if row_code == code:
+                totals[day] = totals.get(day, 0) + amount
+        return {day: cents / 100 for day, cents in totals.items()}
+
+    def description(self, offset):
+        start = self._heap_start + offset
+        length, = LENGTH.unpack_from(self._buffer, start)
+        return bytes(self._buffer[start + LENGTH.size:start + LENGTH.size + length]).decode("utf-8")
+
+    def rows(self, start=None, end=None):
+        """Decode the transactions with dates in [start, end)"""
+        lo, hi = self.span(start, end)
+        section = self._buffer[HEADER.size + lo * RECORD.size:HEADER.size + hi * RECORD.size]
+        return [
+            {
+                'id': transaction_id,
+                'amount': amount / 100,
+                'category': CATEGORIES[category],
+                'description': self.description(offset),
+                'date': from_epoch_day(day)
+            }
+            for day, transaction_id, amount, offset, category in RECORD.iter_unpack(section)
+        ]
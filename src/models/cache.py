@@ -0,0 +1,69 @@
+"""
+Memoization of ledger queries between mutations.
+"""
+import functools
+import inspect
+
+
+class QueryCache:
+    """
+    Results keyed by query name and arguments, valid for one generation.
+    The owner bumps its generation on every mutation; the first lookup
+    after that drops all entries.
+    """
+
+    def __init__(self):
+        self.generation = None
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+
+    def lookup(self, key, generation, compute):
+        if generation != self.generation:
+            self._entries.clear()
+            self.generation = generation
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self._entries[key] = compute()
+        else:
+            self.hits += 1
+        return value
+
+    def peek(self, key, generation):
+        """Cached value for key if present and current, without counting a hit or miss"""
+        if generation != self.generation:
+            return None
+        return self._entries.get(key)
+
+    def clear(self):
+        self._entries.clear()
+        self.generation = None
+
+    @property
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+
+def cached_query(method):
+    """
+    Cache a query method of an object with query_cache and generation
+    attributes. Arguments must be hashable, and since a result is shared
+    by every caller until the next mutation it should be immutable.
+    """
+    name = method.__name__
+    signature = inspect.signature(method)
+
+    def key(*args, **kwargs):
+        """Cache key of a call, the same however the arguments are passed"""
+        bound = signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        return name, tuple(bound.arguments.values())[1:]
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self.query_cache.lookup(
+            key(*args, **kwargs), self.generation, lambda: method(self, *args, **kwargs))
+    wrapper.key = key
+    return wrapper
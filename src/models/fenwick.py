@@ -0,0 +1,41 @@
+"""
+Fenwick (binary indexed) tree for prefix sums with point updates.
+"""
+
+
+class FenwickTree:
+    """Prefix sums over a fixed number of slots, O(log n) update and query"""
+
+    def __init__(self, size):
+        self._tree = [0.0] * (size + 1)
+
+    @classmethod
+    def from_values(cls, values):
+        """Build a tree holding values in O(n)"""
+        tree = cls(len(values))
+        data = tree._tree
+        for i, value in enumerate(values, 1):
+            data[i] += value
+            parent = i + (i & -i)
+            if parent < len(data):
+                data[parent] += data[i]
+        return tree
+
+    def __len__(self):
+        return len(self._tree) - 1
+
+    def add(self, index, delta):
+        """Add delta to slot index"""
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index):
+        """Sum of slots [0, index)"""
+        total = 0.0
+        i = min(index, len(self._tree) - 1)
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
@@ -0,0 +1,71 @@
+"""
+Undo/redo command log for ledger mutations.
+"""
+from collections import deque
+from contextlib import contextmanager
+
+# Delta kinds. Each delta is a small tuple:
+#   (ADD, record)                       record was inserted
+#   (DELETE, record)                    record was removed
+#   (UPDATE, id, month, {field: (old, new)})
+#       only the changed fields, plus the (year, month) the record was in
+ADD = 'add'
+DELETE = 'delete'
+UPDATE = 'update'
+
+
+class CommandLog:
+    """Bounded log of mutation deltas grouped into undoable steps"""
+
+    def __init__(self, depth=100):
+        self._undo = deque(maxlen=depth)  # oldest steps fall off the end
+        self._redo = []
+        self._batch = None
+        self._batch_depth = 0
+
+    @property
+    def can_undo(self):
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    def record(self, delta):
+        """Record a delta as its own step, or as part of the open batch"""
+        if self._batch is not None:
+            self._batch.append(delta)
+        else:
+            self._undo.append((delta,))
+        self._redo.clear()
+
+    @contextmanager
+    def batch(self):
+        """Group every delta recorded inside the block into one step"""
+        if self._batch is None:
+            self._batch = []
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                step, self._batch = self._batch, None
+                if step:
+                    self._undo.append(tuple(step))
+
+    def pop_undo(self):
+        """Take the most recent step to undo, moving it to the redo stack"""
+        step = self._undo.pop()
+        self._redo.append(step)
+        return step
+
+    def pop_redo(self):
+        """Take the most recently undone step, moving it back to the undo log"""
+        step = self._redo.pop()
+        self._undo.append(step)
+        return step
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
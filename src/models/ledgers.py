@@ -0,0 +1,22 @@
+"""
+Per-user ledger locations and loading.
+"""
+import os
+from urllib.parse import quote
+from src.constants import LEDGER_DIR
+from src.models.account import AccountData
+from src.models.storage import LedgerStorage
+
+
+def ledger_path(username, base_dir=LEDGER_DIR):
+    """Directory holding a user's ledger; the name is escaped so any username is safe"""
+    return os.path.join(base_dir, "user_" + quote(username, safe=""))
+
+
+def load_ledger(username, base_dir=LEDGER_DIR, **kwargs):
+    """
+    Open the ledger of a user.
+    Only the summary index is read, so the cost does not grow with the
+    size of other users' ledgers.
+    """
+    return AccountData(LedgerStorage(ledger_path(username, base_dir)), **kwargs)
@@ -0,0 +1,81 @@
+"""
+Memory accounting helpers for the ledger model.
+"""
+import os
+import sys
+import tracemalloc
+from collections import deque
+
+_CONTAINERS = (list, tuple, set, frozenset, deque)
+
+
+def deep_size(obj, seen):
+    """
+    Bytes of obj plus everything reachable through dicts, sequences and
+    __slots__ objects. Objects whose id is in seen are skipped and every
+    object counted is added to seen, so sharing one seen set across calls
+    attributes each object to the first structure that reaches it.
+    """
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, _CONTAINERS):
+            stack.extend(item)
+        elif hasattr(type(item), '__slots__'):
+            stack.extend(getattr(item, name) for name in type(item).__slots__
+                         if hasattr(item, name))
+    return total
+
+
+def _module_name(filename):
+    """Dotted module path of a source file under the working directory, else its file name"""
+    path = os.path.relpath(filename)
+    if path.startswith(".."):
+        return os.path.basename(filename)
+    return os.path.splitext(path)[0].replace(os.sep, ".")
+
+
+def trace_allocations(func, limit=10):
+    """
+    Call func with tracemalloc running and attribute the memory it left
+    allocated to the modules that allocated it.
+    Returns (result, [(module, bytes, blocks), ...]) largest first.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    by_module = {}
+    ignored = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    for stat in after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "filename"):
+        module = _module_name(stat.traceback[0].filename)
+        size, blocks = by_module.get(module, (0, 0))
+        by_module[module] = (size + stat.size_diff, blocks + stat.count_diff)
+    allocations = sorted(((module, size, blocks) for module, (size, blocks) in by_module.items()),
+                         key=lambda item: -item[1])
+    return result, allocations[:limit]
+
+
+def format_report(report):
+    """Text lines of an AccountData.memory_report()"""
+    lines = [f"{report['transactions']} transactions in memory, "
+             f"{report['per_transaction']:.0f} bytes each"]
+    for name, size in report['structures'].items():
+        lines.append(f"  {name:<12} {size / 1024:>10.1f} KiB")
+    lines.append(f"  {'total':<12} {report['total'] / 1024:>10.1f} KiB")
+    return lines
@@ -0,0 +1,172 @@
+"""
+On-disk ledger storage: one binary file per month plus a summary index.
+"""
+import json
+import os
+import tempfile
+import threading
+from src.models.binary_ledger import MappedLedger, encode, from_epoch_day
+
+INDEX_FILE = "index.json"
+INDEX_KEY = "index"
+
+
+def month_name(key):
+    """Format a (year, month) key as used in file names, e.g. '2024-03'"""
+    return f"{key[0]:04d}-{key[1]:02d}"
+
+
+def parse_month_name(name):
+    year, month = name.split("-")
+    return int(year), int(month)
+
+
+def in_range(transaction, start=None, end=None):
+    """Whether a transaction's date lies in [start, end)"""
+    return ((start is None or transaction['date'] >= start)
+            and (end is None or transaction['date'] < end))
+
+
+class LedgerStorage:
+    """
+    Ledger persisted under a directory.
+    The index holds per-month totals so they are available without
+    reading any month file.
+
+    Writes are atomic (temp file + os.replace) and may come from a worker
+    thread. Each write carries the ledger version it was taken at, and a
+    write older than what is already on disk is dropped. Snapshots staged
+    for a background write are served by load_month until written.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._written = {}  # month key or INDEX_KEY -> version on disk
+        self._staged = {}   # month key -> (version, rows) waiting to be written
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def load_index(self):
+        """
+        Load the summary index
+        Returns dict with 'next_id' and 'months' mapping (year, month) to
+        {'income', 'paid', 'count', 'first_id', 'last_id'}
+        """
+        path = self._path(INDEX_FILE)
+        if not os.path.exists(path):
+            return {'next_id': 1, 'months': {}}
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return {
+            'next_id': data['next_id'],
+            'months': {parse_month_name(name): summary
+                       for name, summary in data['months'].items()}
+        }
+
+    def save_index(self, next_id, months, version=None):
+        data = {
+            'next_id': next_id,
+            'months': {month_name(key): summary for key, summary in sorted(months.items())}
+        }
+        self._write(INDEX_KEY, self._path(INDEX_FILE), json.dumps(data).encode("utf-8"), version)
+
+    def _staged_rows(self, key):
+        with self._lock:
+            staged = self._staged.get(key)
+        return None if staged is None else staged[1]
+
+    def _month_path(self, key):
+        return self._path(month_name(key) + ".bin")
+
+    def load_month(self, key, start=None, end=None):
+        """Load the transactions of one month, optionally only dates in [start, end)"""
+        rows = self._staged_rows(key)
+        if rows is not None:
+            return [dict(t) for t in rows if in_range(t, start, end)]
+
+        path = self._month_path(key)
+        if not os.path.exists(path):
+            return []
+        with MappedLedger(path) as ledger:
+            return ledger.rows(start, end)
+
+    def month_totals(self, key, start=None, end=None):
+        """
+        Per-category totals of one month for dates in [start, end),
+        computed over the mapped file without decoding rows
+        """
+        path = self._month_path(key)
+        if self._staged_rows(key) is not None or not os.path.exists(path):
+            totals = {}
+            for t in self.load_month(key, start, end):
+                totals[t['category']] = totals.get(t['category'], 0.0) + t['amount']
+            return totals
+        with MappedLedger(path) as ledger:
+            return ledger.totals(start, end)
+
+    def daily_totals(self, key, category):
+        """Amount per date of one category in a month, as a dict date -> total"""
+        path = self._month_path(key)
+        if self._staged_rows(key) is not None or not os.path.exists(path):
+            totals = {}
+            for t in self.load_month(key):
+                if t['category'] == category:
+                    day = t['date'].date()
+                    totals[day] = totals.get(day, 0.0) + t['amount']
+            return totals
+        with MappedLedger(path) as ledger:
+            return {from_epoch_day(day).date(): total
+                    for day, total in ledger.daily_totals(category).items()}
+
+    def save_month(self, key, transactions, version=None):
+        """Write the transactions of one month, removing the file when empty"""
+        self._write(key, self._month_path(key), encode(transactions) if transactions else None, version)
+
+    def stage(self, snapshot):
+        """Make a snapshot visible to load_month before it is written"""
+        with self._lock:
+            for key, staged in snapshot['months'].items():
+                self._staged[key] = staged
+
+    def write_snapshot(self, snapshot):
+        """Write a snapshot taken with AccountData.snapshot"""
+        for key, (version, transactions) in snapshot['months'].items():
+            self.save_month(key, transactions, version)
+        version, next_id, months = snapshot['index']
+        self.save_index(next_id, months, version)
+
+    def _is_stale(self, key, version):
+        return version is not None and version < self._written.get(key, -1)
+
+    def _write(self, key, path, data, version):
+        """Atomically replace path with data bytes (None removes the file)"""
+        with self._lock:
+            if self._is_stale(key, version):
+                return
+
+        tmp_path = None
+        if data is not None:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+        with self._lock:
+            if self._is_stale(key, version):
+                # A newer version was written while this one was serialized
+                if tmp_path:
+                    os.remove(tmp_path)
+                return
+            if tmp_path:
+                os.replace(tmp_path, path)
+            elif os.path.exists(path):
+                os.remove(path)
+            if version is not None:
+                self._written[key] = version
+            staged = self._staged.get(key)
+            if staged is not None and (version is None or staged[0] <= version):
+                del self._staged[key]
@@ -0,0 +1,341 @@
+"""
+Local HTTP/JSON API over the ledger.
+
+    GET    /summary                     totals shown on the account screen
+    GET    /transactions?text=&category=&min=&max=&from=&to=
+    GET    /transactions/<id>
+    POST   /transactions                one transaction object, or a list of them
+    DELETE /transactions/<id>
+
+Transactions are {"amount", "category", "description", "date": "YYYY-MM-DD"};
+responses add the "id". Connections are kept alive (HTTP/1.1), so clients
+can send many requests without reconnecting, and a list posted in one
+request is added as a single batch.
+"""
+import asyncio
+import json
+import logging
+import queue
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, parse_qs
+from src.constants import API_HOST, API_PORT, API_POLL_MS, API_IDLE_TIMEOUT, API_MAX_BODY
+from src.utils.validation import validate_amount
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ("Income", "Paid")
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_date(text, name="date"):
+    try:
+        return datetime.strptime(text, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        raise ApiError(400, f"{name} must be a date (YYYY-MM-DD)")
+
+
+def reject_constant(name):
+    """json.loads hook for NaN and Infinity, which are not JSON"""
+    raise ValueError(f"invalid JSON constant {name}")
+
+
+def parse_amount(value, name="amount"):
+    # bool is an int subclass, but true is not an amount
+    is_number = isinstance(value, (int, float, str)) and not isinstance(value, bool)
+    is_valid, amount = validate_amount(value) if is_number else (False, None)
+    if not is_valid:
+        raise ApiError(400, f"{name} must be a number")
+    return amount
+
+
+def parse_transaction(data):
+    """add_transaction arguments from a JSON object"""
+    if not isinstance(data, dict):
+        raise ApiError(400, "a transaction must be an object")
+    if data.get('category') not in CATEGORIES:
+        raise ApiError(400, f"category must be one of {', '.join(CATEGORIES)}")
+    description = data.get('description')
+    if not isinstance(description, str) or not description.strip():
+        raise ApiError(400, "description is required")
+    return {
+        'amount': parse_amount(data.get('amount')),
+        'category': data['category'],
+        'description': description.strip(),
+        'date': parse_date(data.get('date')),
+    }
+
+
+def transaction_json(transaction):
+    return {
+        'id': transaction['id'],
+        'date': transaction['date'].strftime("%Y-%m-%d"),
+        'category': transaction['category'],
+        'amount': transaction['amount'],
+        'description': transaction['description'],
+    }
+
+
+class LedgerApiServer:
+    """
+    Serve the API from a background thread running its own asyncio loop.
+    Reads use AccountData.read_snapshot() in a worker thread and never
+    wait for the Tk thread. Mutations are queued as jobs that the Tk
+    thread runs every API_POLL_MS, so listeners (the account screen) run
+    there; the result is handed back to the waiting connection through
+    its event loop. Each request is its own undo step (a posted list is
+    one batch); jobs drained in the same poll notify listeners once, so
+    a burst of requests refreshes the screen once.
+    """
+
+    def __init__(self, root, account_data, host=API_HOST, port=API_PORT):
+        self.root = root
+        self.account_data = account_data
+        self.host = host
+        self.port = port
+        self._jobs = queue.Queue()
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._after_id = None
+        self._started = threading.Event()
+        self._error = None
+
+    def start(self):
+        """Start serving; raises OSError if the port cannot be bound"""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._started.wait()
+        if self._error is not None:
+            raise self._error
+        self._after_id = self.root.after(API_POLL_MS, self._drain)
+        logger.info("Ledger API listening on http://%s:%s", self.host, self.port)
+        return self
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=2.0)
+
+    # Event loop thread
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._serve, self.host, self.port))
+            self.port = self._server.sockets[0].getsockname()[1]  # resolves port 0
+        except OSError as e:
+            self._error = e
+            self._started.set()
+            self._loop.close()
+            return
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            # Stop accepting, then let cancelled connections finish closing
+            self._server.close()
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+    async def _read(self, job):
+        """Run job(snapshot) on a worker thread against a fresh read snapshot"""
+        return await self._loop.run_in_executor(
+            None, lambda: job(self.account_data.read_snapshot()))
+
+    async def _call(self, job):
+        """Run job(account_data) on the Tk thread and wait for its result"""
+        future = self._loop.create_future()
+        self._jobs.put((job, future))
+        return await future
+
+    async def _serve(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), API_IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                keep_alive = await self._handle(request_line, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # stop() cancels open connections; ending normally keeps the
+            # stream callback from reporting the cancellation as an error
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, request_line, reader, writer):
+        """Answer one request; returns whether to keep the connection open"""
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            self._respond(writer, 400, {'error': "malformed request line"}, False)
+            return False
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+        try:
+            length = int(headers.get("content-length", 0) or 0)
+        except ValueError:
+            self._respond(writer, 400, {'error': "invalid Content-Length"}, False)
+            return False
+        if length > API_MAX_BODY:
+            self._respond(writer, 413, {'error': "request body too large"}, False)
+            return False
+        body = await reader.readexactly(length) if length else b""
+
+        try:
+            status, payload = await self._dispatch(method, target, body)
+        except ApiError as e:
+            status, payload = e.status, {'error': str(e)}
+        except Exception:
+            logger.exception("API request %s %s failed", method, target)
+            status, payload = 500, {'error': "internal error"}
+        self._respond(writer, status, payload, keep_alive)
+        return keep_alive
+
+    def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+        )
+
+    async def _dispatch(self, method, target, body):
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+
+        if parts == ["summary"] and method == "GET":
+            return 200, await self._read(lambda data: {
+                'income': data.income,
+                'paid': data.paid,
+                'total_saving': data.total_saving,
+                'monthly_total': data.monthly_total,
+            })
+
+        if parts == ["transactions"]:
+            if method == "GET":
+                return 200, await self._query(parse_qs(url.query))
+            if method == "POST":
+                return 201, await self._insert(body)
+            raise ApiError(405, f"{method} not allowed on /transactions")
+
+        if len(parts) == 2 and parts[0] == "transactions":
+            try:
+                transaction_id = int(parts[1])
+            except ValueError:
+                raise ApiError(404, "no such transaction")
+
+            def find(data):
+                try:
+                    return transaction_json(data.get_transaction(transaction_id))
+                except KeyError:
+                    return None
+
+            def delete(data):
+                try:
+                    return transaction_json(data.delete_transaction(transaction_id))
+                except KeyError:
+                    return None
+
+            if method not in ("GET", "DELETE"):
+                raise ApiError(405, f"{method} not allowed on a transaction")
+            result = await (self._read(find) if method == "GET" else self._call(delete))
+            if result is None:
+                raise ApiError(404, "no such transaction")
+            return 200, result
+
+        raise ApiError(404, "not found")
+
+    async def _query(self, params):
+        def param(name):
+            values = params.get(name)
+            return values[-1] if values else None
+
+        category = param("category")
+        if category is not None and category not in CATEGORIES:
+            raise ApiError(400, f"category must be one of {', '.join(CATEGORIES)}")
+        min_amount = parse_amount(param("min"), "min") if param("min") else None
+        max_amount = parse_amount(param("max"), "max") if param("max") else None
+        start = parse_date(param("from"), "from") if param("from") else None
+        end = parse_date(param("to"), "to") + timedelta(days=1) if param("to") else None  # inclusive
+        text = param("text") or ""
+        return await self._read(lambda data: [
+            transaction_json(t) for t in
+            data.filter_transactions(text, category, min_amount, max_amount, start, end)
+        ])
+
+    async def _insert(self, body):
+        try:
+            data = json.loads(body or b"null", parse_constant=reject_constant)
+        except ValueError:
+            raise ApiError(400, "body must be JSON")
+        if isinstance(data, list):
+            rows = [parse_transaction(item) for item in data]
+            ids = await self._call(lambda account_data: account_data.add_transactions(rows))
+            return {'ids': ids}
+        row = parse_transaction(data)
+        return {'id': await self._call(lambda account_data: account_data.add_transaction(**row))}
+
+    # Tk thread
+
+    def _drain(self):
+        """Run the queued jobs on the Tk thread and post their results back"""
+        jobs = []
+        while True:
+            try:
+                jobs.append(self._jobs.get_nowait())
+            except queue.Empty:
+                break
+        if jobs:
+            with self.account_data.deferred_notifications():
+                for job, future in jobs:
+                    try:
+                        result = job(self.account_data)
+                    except Exception as e:
+                        self._loop.call_soon_threadsafe(self._settle, future, None, e)
+                    else:
+                        self._loop.call_soon_threadsafe(self._settle, future, result, None)
+        self._after_id = self.root.after(API_POLL_MS, self._drain)
+
+    @staticmethod
+    def _settle(future, result, error):
+        if future.done():  # the connection went away
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
@@ -0,0 +1,88 @@
+"""
+Debounced background autosave of the ledger.
+"""
+import logging
+import queue
+import threading
+from src.constants import AUTOSAVE_DELAY_MS, AUTOSAVE_MAX_CHANGES
+
+logger = logging.getLogger(__name__)
+
+
+class AutosaveService:
+    """
+    Save the ledger shortly after it changes, without blocking Tk.
+    Changes are debounced: a save happens once the ledger has been idle
+    for delay_ms, or immediately after max_changes unsaved changes. The
+    snapshot is taken on the Tk thread (a copy of the changed months only)
+    and written by a single worker thread. Months of a snapshot that
+    fails to be written are marked changed again and retried with the
+    next save.
+    """
+
+    def __init__(self, root, account_data, delay_ms=AUTOSAVE_DELAY_MS,
+                 max_changes=AUTOSAVE_MAX_CHANGES):
+        self.root = root
+        self.account_data = account_data
+        self.delay_ms = delay_ms
+        self.max_changes = max_changes
+        self._changes = 0
+        self._after_id = None
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+        account_data.add_listener(self.mark_dirty)
+
+    def mark_dirty(self):
+        """Called on each ledger change; (re)schedules the pending save"""
+        self._changes += 1
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self._changes >= self.max_changes:
+            self.save_now()
+        else:
+            self._after_id = self.root.after(self.delay_ms, self.save_now)
+
+    def save_now(self):
+        """Hand a snapshot of the pending changes to the worker thread"""
+        self._after_id = None
+        self._changes = 0
+        snapshot = self.account_data.snapshot()
+        if snapshot is not None:
+            self._queue.put(snapshot)
+
+    def flush(self):
+        """
+        Save everything and wait until it is on disk (e.g. when closing).
+        Returns False if some changes could not be written.
+        """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        # Let pending writes finish first, so months of a failed one are
+        # dirty again and go into the final snapshot
+        self._queue.join()
+        self.save_now()
+        self._queue.join()
+        return not self.account_data.dirty
+
+    def stop(self):
+        """Flush, then stop the worker and stop listening to the ledger; returns flush()"""
+        self.account_data.remove_listener(self.mark_dirty)
+        saved = self.flush()
+        self._queue.put(None)
+        self._worker.join()
+        return saved
+
+    def _run(self):
+        while True:
+            snapshot = self._queue.get()
+            try:
+                if snapshot is None:
+                    return
+                self.account_data.storage.write_snapshot(snapshot)
+            except Exception:
+                logger.exception("Autosave failed")
+                self.account_data.mark_unsaved(snapshot)
+            finally:
+                self._queue.task_done()
@@ -2,7 +2,9 @@
 Authentication utilities.
 """
 import logging
+from src.utils.profiling import profiled
 
+@profiled()
 def validate_credentials(credentials, username, password):
     """
     Validate user credentials
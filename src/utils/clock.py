@@ -0,0 +1,129 @@
+"""
+Clock service with cached day and month boundaries.
+"""
+import time
+from datetime import date, datetime, timedelta
+
+# Delay after midnight before the rollover callback runs, so the new day is visible
+ROLLOVER_MARGIN_MS = 50
+
+
+class Clock:
+    """
+    Current date information computed once per day.
+    The cached values are refreshed on the first access after midnight
+    (one float comparison per access), and schedule_rollover lets a Tk
+    widget react to the day change with a single after() call.
+    """
+
+    def __init__(self):
+        self.epoch = 0  # incremented at every day change
+        self._refresh()
+
+    def now(self):
+        return datetime.now()
+
+    def _timestamp(self):
+        return time.time()
+
+    def _refresh(self):
+        today = self.now().date()
+        next_month = (date(today.year + 1, 1, 1) if today.month == 12
+                      else date(today.year, today.month + 1, 1))
+        next_midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        self._today = today
+        self._month_start = today.replace(day=1)
+        self._month_end = next_month
+        self._today_text = today.strftime("%B %d, %Y")
+        self._month_range_text = (f"{today.month}/1 - "
+                                  f"{today.month}/{(next_month - timedelta(days=1)).day}")
+        self._deadline = next_midnight.timestamp()
+        self.epoch += 1
+
+    def _check(self):
+        if self._timestamp() >= self._deadline:
+            self._refresh()
+
+    @property
+    def today(self):
+        self._check()
+        return self._today
+
+    @property
+    def year(self):
+        return self.today.year
+
+    @property
+    def month_key(self):
+        """(year, month) of the current month"""
+        today = self.today
+        return today.year, today.month
+
+    @property
+    def month_start(self):
+        """First day of the current month"""
+        self._check()
+        return self._month_start
+
+    @property
+    def month_end(self):
+        """First day of the next month"""
+        self._check()
+        return self._month_end
+
+    @property
+    def today_text(self):
+        """Current date formatted like 'January 05, 2024'"""
+        self._check()
+        return self._today_text
+
+    @property
+    def month_range_text(self):
+        """Current month range formatted like '1/1 - 1/31'"""
+        self._check()
+        return self._month_range_text
+
+    def ms_until_midnight(self):
+        return max(0, int((self._deadline - self._timestamp()) * 1000))
+
+    def schedule_rollover(self, widget, callback):
+        """
+        Call callback shortly after each midnight while widget exists.
+        Returns a handle for cancel_rollover.
+        """
+        handle = {'after_id': None}
+
+        def fire():
+            self._check()
+            callback()
+            handle['after_id'] = widget.after(self.ms_until_midnight() + ROLLOVER_MARGIN_MS, fire)
+
+        handle['after_id'] = widget.after(self.ms_until_midnight() + ROLLOVER_MARGIN_MS, fire)
+        handle['widget'] = widget
+        return handle
+
+    def cancel_rollover(self, handle):
+        if handle and handle['after_id'] is not None:
+            handle['widget'].after_cancel(handle['after_id'])
+            handle['after_id'] = None
+
+
+class FakeClock(Clock):
+    """Clock with a settable time, for tests and benchmarks"""
+
+    def __init__(self, now):
+        self._fake_now = now
+        super().__init__()
+
+    def now(self):
+        return self._fake_now
+
+    def _timestamp(self):
+        return self._fake_now.timestamp()
+
+    def set(self, now):
+        self._fake_now = now
+
+    def advance(self, **kwargs):
+        """Move the time forward by a timedelta given as keyword arguments"""
+        self._fake_now += timedelta(**kwargs)
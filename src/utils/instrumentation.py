@@ -0,0 +1,187 @@
+"""
+Optional event-loop latency and handler timing instrumentation.
+
+Set WEBABIQ_INSTRUMENT to a log file path (or to 1 for instrumentation.log)
+to enable it. When it is unset, timed() returns functions unchanged and
+span() returns a shared no-op context, so instrumented code pays nothing.
+"""
+import collections
+import contextlib
+import functools
+import os
+import time
+import tkinter as tk
+from datetime import datetime
+from src.constants import INSTRUMENT_PROBE_MS, INSTRUMENT_SLOW_MS, INSTRUMENT_REPORT_MS
+
+_setting = os.environ.get("WEBABIQ_INSTRUMENT", "")
+ENABLED = _setting not in ("", "0")
+LOG_PATH = "instrumentation.log" if _setting in ("", "0", "1") else _setting
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended
+BUCKETS_MS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+# (name, wall-clock start, seconds); deque appends are thread safe, so the
+# splash thread can record too. Drained by the monitor on the Tk thread.
+_samples = collections.deque()
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def record(name, seconds, started=None):
+    """Add one timing sample"""
+    _samples.append((name, started if started is not None else time.time() - seconds, seconds))
+
+
+def timed(name=None):
+    """Decorator recording the duration of every call (no-op when disabled)"""
+    def decorate(func):
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+@contextlib.contextmanager
+def _span(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def span(name):
+    """Context manager recording the duration of a block (no-op when disabled)"""
+    return _span(name) if ENABLED else _NULL_SPAN
+
+
+class Histogram:
+    """Counts of durations per power-of-two millisecond bucket"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        index = 0
+        while index < len(BUCKETS_MS) and ms >= BUCKETS_MS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def format(self):
+        bounds = [f"<{bound}" for bound in BUCKETS_MS] + [f">={BUCKETS_MS[-1]}"]
+        buckets = " ".join(f"{bound}:{count}" for bound, count in zip(bounds, self.counts) if count)
+        return (f"n={self.count} mean={self.total / self.count:.2f}ms "
+                f"max={self.max:.2f}ms [{buckets}]")
+
+
+def _callback_name(func):
+    name = getattr(func, "__qualname__", type(func).__name__)
+    if name == "Misc.after.<locals>.callit":
+        return "after:" + func.__name__  # after() wraps callbacks but copies their name
+    return name
+
+
+class _TimedCallWrapper(tk.CallWrapper):
+    """Times every Tk callback: bindings, commands and after() callbacks"""
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        try:
+            return super().__call__(*args)
+        finally:
+            record(_callback_name(self.func), time.perf_counter() - start)
+
+
+class EventLoopMonitor:
+    """
+    Measures event-loop latency and handler durations.
+    A probe re-arms itself with after() and records how late each firing
+    is; every report interval the samples collected since the last report
+    are written to the log as per-name histograms, followed by the
+    individual events that took at least slow_ms.
+    """
+
+    def __init__(self, root, path=LOG_PATH, probe_ms=INSTRUMENT_PROBE_MS,
+                 slow_ms=INSTRUMENT_SLOW_MS, report_ms=INSTRUMENT_REPORT_MS):
+        self.root = root
+        self.path = path
+        self.probe_ms = probe_ms
+        self.slow_ms = slow_ms
+        self.report_ms = report_ms
+        self._expected = None
+        self._probe_job = None
+        self._report_job = None
+
+    def start(self):
+        tk.CallWrapper = _TimedCallWrapper  # picked up by callbacks registered from now on
+        self._window_start = time.time()
+        self._schedule_probe()
+        self._report_job = self.root.after(self.report_ms, self._report)
+        return self
+
+    def stop(self):
+        """Cancel the probe and write what was collected since the last report"""
+        for job in (self._probe_job, self._report_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self._probe_job = self._report_job = None
+        self.write_report()
+
+    def _schedule_probe(self):
+        self._expected = time.perf_counter() + self.probe_ms / 1000
+        self._probe_job = self.root.after(self.probe_ms, self._probe)
+
+    def _probe(self):
+        lateness = time.perf_counter() - self._expected
+        record("event-loop latency", max(0.0, lateness))
+        self._schedule_probe()
+
+    def _report(self):
+        self.write_report()
+        self._report_job = self.root.after(self.report_ms, self._report)
+
+    def write_report(self):
+        """Append the histograms and slow events of the current window to the log"""
+        histograms = {}
+        slow = []
+        while _samples:
+            name, started, seconds = _samples.popleft()
+            ms = seconds * 1000
+            histograms.setdefault(name, Histogram()).add(ms)
+            if ms >= self.slow_ms:
+                slow.append((started, name, ms))
+
+        now = time.time()
+        lines = [f"== {datetime.fromtimestamp(now):%Y-%m-%d %H:%M:%S} "
+                 f"window {now - self._window_start:.1f}s"]
+        for name in sorted(histograms, key=lambda n: -histograms[n].total):
+            lines.append(f"  {name}: {histograms[name].format()}")
+        for started, name, ms in sorted(slow):
+            lines.append(f"  SLOW {datetime.fromtimestamp(started):%H:%M:%S.%f} {name} {ms:.1f}ms")
+        self._window_start = now
+
+        try:
+            with open(self.path, "a", encoding="utf-8") as log:
+                log.write("\n".join(lines) + "\n")
+        except OSError as e:
+            print(f"Error writing instrumentation log: {e}")
+
+
+def start_monitor(root):
+    """Start an EventLoopMonitor when instrumentation is enabled; returns it or None"""
+    return EventLoopMonitor(root).start() if ENABLED else None
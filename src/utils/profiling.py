@@ -0,0 +1,143 @@
+"""
+In-memory timing registry for model and view hot paths.
+
+profiled() and profile_block() add call counts and recent durations to the
+shared registry; report() summarizes them with p50/p95/p99 latencies, and
+capture() runs cProfile for a few seconds of normal use. Set
+WEBABIQ_PROFILE=0 to leave decorated functions unwrapped.
+"""
+import cProfile
+import functools
+import io
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from src.constants import PROFILE_SAMPLES
+
+ENABLED = os.environ.get("WEBABIQ_PROFILE", "1") != "0"
+
+
+class TimingStats:
+    """Call count, total time and a window of recent durations for one name"""
+
+    def __init__(self, samples):
+        self.count = 0
+        self.total = 0.0
+        self.recent = deque(maxlen=samples)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.recent.append(seconds)
+
+    def percentile(self, fraction):
+        """Nearest-rank percentile of the recent durations, in seconds"""
+        ordered = sorted(self.recent)
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ProfileRegistry:
+    """Timing statistics by name; safe to record into from any thread"""
+
+    def __init__(self, samples=PROFILE_SAMPLES):
+        self.samples = samples
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._profiler = None
+
+    def record(self, name, seconds):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = TimingStats(self.samples)
+            stats.add(seconds)
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+    def stats(self):
+        """{name: {'count', 'total', 'p50', 'p95', 'p99'}} with times in seconds"""
+        with self._lock:
+            return {
+                name: {
+                    'count': stats.count,
+                    'total': stats.total,
+                    'p50': stats.percentile(0.50),
+                    'p95': stats.percentile(0.95),
+                    'p99': stats.percentile(0.99),
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def report(self):
+        """Text table of the statistics, slowest total first"""
+        rows = sorted(self.stats().items(), key=lambda item: -item[1]['total'])
+        width = max([len(name) for name, _ in rows] + [4])
+        lines = [f"{'name':<{width}} {'calls':>8} {'total ms':>10} "
+                 f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"]
+        for name, stats in rows:
+            lines.append(
+                f"{name:<{width}} {stats['count']:>8} {stats['total'] * 1000:>10.1f} "
+                f"{stats['p50'] * 1000:>8.3f} {stats['p95'] * 1000:>8.3f} {stats['p99'] * 1000:>8.3f}"
+            )
+        return "\n".join(lines)
+
+    def capture(self, widget, seconds, path, on_done=None):
+        """
+        Run cProfile on the Tk thread for the next seconds and write the
+        stats to path. Returns False if a capture is already running.
+        on_done receives the top of the cumulative-time listing.
+        """
+        if self._profiler is not None:
+            return False
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+        def finish():
+            profiler, self._profiler = self._profiler, None
+            profiler.disable()
+            profiler.dump_stats(path)
+            if on_done:
+                text = io.StringIO()
+                pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(20)
+                on_done(text.getvalue())
+
+        widget.after(int(seconds * 1000), finish)
+        return True
+
+
+registry = ProfileRegistry()
+
+
+def profiled(name=None):
+    """Decorator adding each call's duration to the registry"""
+    def decorate(func):
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                registry.record(label, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def profile_block(name):
+    """Context manager adding a block's duration to the registry"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.record(name, time.perf_counter() - start)
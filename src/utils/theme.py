@@ -0,0 +1,202 @@
+"""
+Shared fonts, colours and ttk styles.
+"""
+import weakref
+import tkinter.font as tkfont
+from tkinter import ttk
+from src.constants import PINK_GRADIENT_START, PINK_GRADIENT_END, PINK_BUTTON, DARK_TEXT
+
+# Colour roles used by every screen, per palette
+PALETTES = {
+    "light": {
+        "background": PINK_GRADIENT_END,  # screen background
+        "form": PINK_GRADIENT_START,      # input screen background
+        "accent": PINK_BUTTON,
+        "surface": "white",
+        "field": "#FFE4E1",               # entry background
+        "text": "black",
+        "muted": "#666666",
+        "on_accent": "white",             # text on accent backgrounds
+        "splash": "#FF69B4",
+        "invalid": "#FFC0C0",
+        "grid": "#CCCCCC",                # chart baseline
+        "line": DARK_TEXT,                # chart savings line
+        # Spending heatmap, from no spending to the busiest days
+        "heat_0": "#F2F2F2",
+        "heat_1": "#FFD1DC",
+        "heat_2": "#FFA3B8",
+        "heat_3": "#F0739A",
+        "heat_4": PINK_BUTTON,
+    },
+    "dark": {
+        "background": "#3A2A30",
+        "form": "#2E2226",
+        "accent": PINK_BUTTON,
+        "surface": "#1E1E1E",
+        "field": "#3B2F33",
+        "text": "#F0F0F0",
+        "muted": "#AAAAAA",
+        "on_accent": "white",
+        "splash": "#FF69B4",
+        "invalid": "#7A2E3A",
+        "grid": "#555555",
+        "line": "#DDDDDD",
+        "heat_0": "#2A2A2A",
+        "heat_1": "#5C2E3E",
+        "heat_2": "#8A3A55",
+        "heat_3": "#B9466D",
+        "heat_4": PINK_BUTTON,
+    },
+}
+
+# Current colour of each role; change it with set_colors or set_palette
+COLORS = dict(PALETTES["light"])
+
+# Widget options that take a colour; themed widgets give them a role name
+COLOR_OPTIONS = {
+    "bg", "background", "fg", "foreground", "activebackground", "activeforeground",
+    "selectcolor", "selectbackground", "selectforeground", "highlightbackground",
+    "highlightcolor", "insertbackground", "disabledforeground", "readonlybackground",
+}
+
+# Font roles -> (family, size, weight)
+FONT_SPECS = {
+    "display": ("Arial", 32, "bold"),
+    "heading": ("Arial", 24, "bold"),
+    "icon": ("Arial", 24, "normal"),
+    "title": ("Arial", 16, "bold"),
+    "label": ("Arial", 14, "bold"),
+    "field": ("Arial", 14, "normal"),
+    "body": ("Arial", 12, "normal"),
+    "body_bold": ("Arial", 12, "bold"),
+    "cell": ("Arial", 11, "normal"),
+    "small": ("Arial", 10, "normal"),
+    "small_bold": ("Arial", 10, "bold"),
+    "tiny": ("Arial", 9, "normal"),
+}
+
+# Tk names of the shared fonts; widgets pass these as font=FONTS[role]
+FONTS = {role: "Webabiq" + role.title().replace("_", "") for role in FONT_SPECS}
+
+_fonts = {}  # role -> tkfont.Font; Tk deletes a named font once its object is collected
+_style = None
+_widgets = weakref.WeakKeyDictionary()  # widget -> {option: colour role}
+_tags = weakref.WeakKeyDictionary()     # Treeview -> {tag: {option: colour role}}
+_listeners = []  # weakref.WeakMethod of callbacks run after the colours change
+
+
+def init_theme(root):
+    """
+    Create the named fonts and ttk styles once for the application.
+    Must run before the first screen is built.
+    """
+    global _style
+    for role, (family, size, weight) in FONT_SPECS.items():
+        _fonts[role] = tkfont.Font(root, name=FONTS[role], family=family,
+                                   size=size, weight=weight, exists=False)
+    _style = ttk.Style(root)
+    _configure_styles()
+
+
+def _configure_styles():
+    _style.configure(
+        "Account.Treeview",
+        background=COLORS["surface"],
+        foreground=COLORS["text"],
+        fieldbackground=COLORS["surface"],
+        rowheight=24
+    )
+    _style.configure(
+        "Account.Treeview.Heading",
+        background=COLORS["accent"],
+        foreground=COLORS["on_accent"],
+        font=FONTS["small_bold"],
+        relief="flat"
+    )
+
+
+def _split_roles(options):
+    """Colour options whose value names a role -> {option: role}, removed from options"""
+    roles = {name: value for name, value in options.items()
+             if name in COLOR_OPTIONS and isinstance(value, str) and value in COLORS}
+    for name in roles:
+        del options[name]
+    return roles
+
+
+def themed(widget_class, *args, **options):
+    """
+    Create a tk widget whose colour options name COLORS roles, e.g.
+    themed(tk.Label, parent, text="Hi", bg="surface", fg="accent").
+    The widget follows later colour changes; see themed_config.
+    """
+    roles = _split_roles(options)
+    widget = widget_class(*args, **options)
+    themed_config(widget, **roles)
+    return widget
+
+
+def themed_config(widget, **options):
+    """
+    Configure a widget like widget.configure. Colour options that name
+    COLORS roles are remembered, so set_colors updates them; any other
+    colour value stops that option from following the theme.
+    """
+    roles = _split_roles(options)
+    remembered = _widgets.setdefault(widget, {})
+    for name in options:
+        remembered.pop(name, None)
+    remembered.update(roles)
+    options.update((name, COLORS[role]) for name, role in roles.items())
+    if options:
+        widget.configure(**options)
+
+
+def themed_tag(tree, tag, **options):
+    """tag_configure a Treeview tag with colour roles that follow the theme"""
+    roles = _split_roles(options)
+    _tags.setdefault(tree, {})[tag] = roles
+    tree.tag_configure(tag, **options, **{name: COLORS[role] for name, role in roles.items()})
+
+
+def add_theme_listener(callback):
+    """
+    Call a bound method after the colours change, for widgets that draw
+    with colours themselves (canvas items, images). Only a weak reference
+    is kept, so destroyed widgets need not unregister.
+    """
+    _listeners.append(weakref.WeakMethod(callback))
+
+
+def set_colors(**colors):
+    """
+    Change colour roles and restyle everything that uses them in one pass:
+    ttk styles, themed widgets and tags, then theme listeners.
+    """
+    COLORS.update(colors)
+    if _style is not None:
+        _configure_styles()
+    for widget, roles in list(_widgets.items()):
+        if roles and widget.winfo_exists():
+            widget.configure(**{name: COLORS[role] for name, role in roles.items()})
+    for tree, tags in list(_tags.items()):
+        if tree.winfo_exists():
+            for tag, roles in tags.items():
+                tree.tag_configure(tag, **{name: COLORS[role] for name, role in roles.items()})
+    for ref in list(_listeners):
+        callback = ref()
+        if callback is None:
+            _listeners.remove(ref)
+        else:
+            callback()
+
+
+def set_palette(name):
+    """Switch every colour role to one of PALETTES"""
+    set_colors(**PALETTES[name])
+
+
+def set_font_scale(scale):
+    """Resize every shared font at once; widgets using them re-layout themselves"""
+    for role, (_, size, _) in FONT_SPECS.items():
+        _fonts[role].configure(size=round(size * scale))
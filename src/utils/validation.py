@@ -1,11 +1,19 @@
 """
 Input validation utilities.
 """
+import math
+from src.constants import MAX_AMOUNT
+from src.utils.profiling import profiled
 
+@profiled()
 def validate_amount(amount_str):
     """Validate that amount is a valid number"""
     try:
         amount = float(amount_str)
-        return True, amount
     except ValueError:
-        return False, "Amount must be a valid number"
\ No newline at end of file
+        return False, "Amount must be a valid number"
+    if not math.isfinite(amount):
+        return False, "Amount must be a valid number"
+    if abs(amount) > MAX_AMOUNT:
+        return False, "Amount is too large"
+    return True, amount
\ No newline at end of file
@@ -1,292 +1,511 @@
 """
 Main account screen view.
 """
+import time
 import tkinter as tk
-from datetime import datetime
-from src.constants import PINK_BUTTON
+from tkinter import ttk, messagebox
+from datetime import datetime, timedelta
+from src.constants import PINK_BUTTON, RENDER_SLICE_MS, TABLE_PAGE_SIZE, FILTER_DEBOUNCE_MS
+from src.models.account import month_key
+from src.utils.validation import validate_amount
+from src.utils.theme import FONTS, themed, themed_config, themed_tag
+from src.utils.instrumentation import timed
+from src.utils.profiling import profiled
 from src.views.input import InputScreen
+from src.views.bulk_input import BulkInputScreen
+from src.components.monthly_chart import MonthlyChart
+from src.components.spending_heatmap import SpendingHeatmap
 
 class AccountScreen(tk.Frame):
-    def __init__(self, parent, account_data):
+    PLACEHOLDER = "…"
+    
+    def __init__(self, parent, account_data=None):
         super().__init__(parent)
         self.parent = parent
-        self.account_data = account_data
+        self.account_data = None
+        self._rollover = None
+        self._render_job = None
         
-        self.configure(bg="#FFB6C1")
+        themed_config(self, bg="background")
         self.pack(fill="both", expand=True)
         
+        # Without account data the screen shows placeholders until
+        # set_account_data is called (e.g. while the ledger loads)
         self.create_widgets()
-        self.update_displays()
+        if account_data is not None:
+            self.set_account_data(account_data)
+    
+    def set_account_data(self, account_data):
+        """Attach the ledger to display, replacing the loading placeholders"""
+        self.account_data = account_data
+        self.enter_button.config(state="normal")
+        self.bulk_button.config(state="normal")
+        for entry in [self.search_entry, *self.filter_entries.values()]:
+            entry.config(state="normal")
+        self.category_box.config(state="readonly")
+        
+        # Income/paid per month of the current year
+        self.chart = MonthlyChart(self.chart_frame, account_data, (account_data.clock.year, 1), height=80)
+        self.chart.pack(fill="x")
+        
+        # Daily spending of the current year
+        self.heatmap = SpendingHeatmap(self.chart_frame, account_data, account_data.clock.year)
+        self.heatmap.pack(pady=(5, 0))
+        
+        self.on_day_change()
+        
+        # Refresh the header and this month's list when the date rolls over
+        self._rollover = account_data.clock.schedule_rollover(self, self.on_day_change)
+        
+        # Refresh whenever the ledger changes (saves, deletes, undo/redo)
+        self.account_data.add_listener(self.update_displays)
     
     def create_widgets(self):
         # Header
-        tk.Label(
+        themed(tk.Label,
             self,
             text="Account Book",
-            font=("Arial", 32, "bold"),
-            bg="#FFB6C1",
-            fg="#E75480"
+            font=FONTS["display"],
+            bg="background",
+            fg="accent"
         ).pack(pady=(20, 10))
         
-        tk.Label(
+        self.date_label = themed(tk.Label,
             self,
-            text=self.account_data.today_date,
-            font=("Arial", 14),
-            bg="#FFB6C1",
-            fg="#666666"
-        ).pack(pady=(0, 20))
+            text=self.PLACEHOLDER,
+            font=FONTS["field"],
+            bg="background",
+            fg="muted"
+        )
+        self.date_label.pack(pady=(0, 20))
         
         # Monthly overview
-        month_frame = tk.Frame(self, bg="white", padx=30, pady=15)
+        month_frame = themed(tk.Frame, self, bg="surface", padx=30, pady=15)
         month_frame.pack(fill="x", padx=20)
         
-        tk.Label(
+        themed(tk.Label,
             month_frame,
             text="THIS MONTH",
-            font=("Arial", 16, "bold"),
-            bg="white",
-            fg="#E75480"
+            font=FONTS["title"],
+            bg="surface",
+            fg="accent"
         ).pack(side="left")
         
-        self.saving_label = tk.Label(
+        self.saving_label = themed(tk.Label,
             month_frame,
-            text=f"${self.account_data.total_saving:.2f}",
-            font=("Arial", 16, "bold"),
-            bg="white",
-            fg="#E75480"
+            text=self.PLACEHOLDER,
+            font=FONTS["title"],
+            bg="surface",
+            fg="accent"
         )
         self.saving_label.pack(side="right")
         
         # Transaction buttons
-        buttons_frame = tk.Frame(self, bg="#FFB6C1")
+        buttons_frame = themed(tk.Frame, self, bg="background")
         buttons_frame.pack(pady=20)
         
         # Income button
-        income_frame = tk.Frame(buttons_frame, bg="#E75480", padx=20, pady=10)
+        income_frame = themed(tk.Frame, buttons_frame, bg="accent", padx=20, pady=10)
         income_frame.pack(side="left", padx=10)
         
-        tk.Label(
+        themed(tk.Label,
             income_frame,
             text="INCOME",
-            font=("Arial", 12, "bold"),
-            bg="#E75480",
-            fg="white"
+            font=FONTS["body_bold"],
+            bg="accent",
+            fg="on_accent"
         ).pack(side="left", padx=5)
         
-        self.income_label = tk.Label(
+        self.income_label = themed(tk.Label,
             income_frame,
-            text=f"${self.account_data.income:.2f}",
-            font=("Arial", 12, "bold"),
-            bg="#E75480",
-            fg="white"
+            text=self.PLACEHOLDER,
+            font=FONTS["body_bold"],
+            bg="accent",
+            fg="on_accent"
         )
         self.income_label.pack(side="right", padx=5)
         
         # Paid button
-        paid_frame = tk.Frame(buttons_frame, bg="#E75480", padx=20, pady=10)
+        paid_frame = themed(tk.Frame, buttons_frame, bg="accent", padx=20, pady=10)
         paid_frame.pack(side="left", padx=10)
         
-        tk.Label(
+        themed(tk.Label,
             paid_frame,
             text="PAID",
-            font=("Arial", 12, "bold"),
-            bg="#E75480",
-            fg="white"
+            font=FONTS["body_bold"],
+            bg="accent",
+            fg="on_accent"
         ).pack(side="left", padx=5)
         
-        self.paid_label = tk.Label(
+        self.paid_label = themed(tk.Label,
             paid_frame,
-            text=f"${self.account_data.paid:.2f}",
-            font=("Arial", 12, "bold"),
-            bg="#E75480",
-            fg="white"
+            text=self.PLACEHOLDER,
+            font=FONTS["body_bold"],
+            bg="accent",
+            fg="on_accent"
         )
         self.paid_label.pack(side="right", padx=5)
         
-        # Enter button
-        tk.Button(
+        # Enter button, enabled once the ledger is loaded
+        self.enter_button = themed(tk.Button,
             self,
             text="Enter!",
-            font=("Arial", 16, "bold"),
-            bg="#FFE4E1",
-            fg="#E75480",
+            font=FONTS["title"],
+            bg="field",
+            fg="accent",
             relief="flat",
             padx=40,
             pady=10,
             command=self.show_entry_dialog,
-            cursor="hand2"
-        ).pack(pady=20)
+            cursor="hand2",
+            state="disabled"
+        )
+        self.enter_button.pack(pady=(20, 5))
+        
+        self.bulk_button = themed(tk.Button,
+            self,
+            text="Bulk input",
+            font=FONTS["small"],
+            bg="background",
+            fg="accent",
+            relief="flat",
+            command=self.show_bulk_entry,
+            cursor="hand2",
+            state="disabled"
+        )
+        self.bulk_button.pack(pady=(0, 15))
         
         # Monthly stats
-        monthly_frame = tk.Frame(self, bg="#E75480")
+        monthly_frame = themed(tk.Frame, self, bg="accent")
         monthly_frame.pack(fill="x", padx=20, pady=10)
         
-        tk.Label(
+        self.year_label = themed(tk.Label,
             monthly_frame,
-            text=str(datetime.now().year),
-            font=("Arial", 14, "bold"),
-            bg="white",
-            fg="#E75480"
-        ).pack(fill="x", pady=5)
+            text=self.PLACEHOLDER,
+            font=FONTS["label"],
+            bg="surface",
+            fg="accent"
+        )
+        self.year_label.pack(fill="x", pady=5)
         
-        month_info_frame = tk.Frame(monthly_frame, bg="#E75480")
+        month_info_frame = themed(tk.Frame, monthly_frame, bg="accent")
         month_info_frame.pack(fill="x", pady=5)
         
-        self.monthly_range_label = tk.Label(
+        self.monthly_range_label = themed(tk.Label,
             month_info_frame,
-            text=self.account_data.monthly_range,
-            font=("Arial", 12),
-            bg="#E75480",
-            fg="white"
+            text=self.PLACEHOLDER,
+            font=FONTS["body"],
+            bg="accent",
+            fg="on_accent"
         )
         self.monthly_range_label.pack(side="left", padx=20)
         
-        self.monthly_amount_label = tk.Label(
+        self.monthly_amount_label = themed(tk.Label,
             month_info_frame,
-            text=f"${self.account_data.monthly_total:.2f}",
-            font=("Arial", 12),
-            bg="#E75480",
-            fg="white"
+            text=self.PLACEHOLDER,
+            font=FONTS["body"],
+            bg="accent",
+            fg="on_accent"
         )
         self.monthly_amount_label.pack(side="right", padx=20)
         
+        # Chart panel, filled once the ledger is loaded
+        self.chart_frame = themed(tk.Frame, self, bg="surface")
+        self.chart_frame.pack(fill="x", padx=20, pady=(0, 10))
+        self.chart = None
+        
+        # Filter bar: text, category, amount range and date range
+        filter_frame = themed(tk.Frame, self, bg="background")
+        filter_frame.pack(fill="x", padx=20, pady=(0, 5))
+        
+        search_row = themed(tk.Frame, filter_frame, bg="background")
+        search_row.pack(fill="x")
+        # The filter controls stay disabled until set_account_data
+        self.search_entry = themed(tk.Entry, search_row, font=FONTS["cell"], bg="field", fg="text",
+                                   relief="flat", state="disabled")
+        self.search_entry.pack(side="left", fill="x", expand=True, ipady=3)
+        self.category_var = tk.StringVar(value="All")
+        self.category_box = ttk.Combobox(
+            search_row,
+            textvariable=self.category_var,
+            values=("All", "Income", "Paid"),
+            state="disabled",
+            width=7
+        )
+        self.category_box.pack(side="right", padx=(5, 0))
+        self.category_box.bind("<<ComboboxSelected>>", self.schedule_filter)
+        
+        range_row = themed(tk.Frame, filter_frame, bg="background")
+        range_row.pack(fill="x", pady=(3, 0))
+        self.filter_entries = {}
+        for name, label, width in (("min", "$", 6), ("max", "–", 6),
+                                   ("start", "From", 10), ("end", "To", 10)):
+            themed(tk.Label, range_row, text=label, font=FONTS["tiny"], bg="background", fg="muted").pack(side="left")
+            entry = themed(tk.Entry, range_row, font=FONTS["tiny"], bg="field", fg="text", relief="flat",
+                           width=width, state="disabled")
+            entry.pack(side="left", padx=(2, 6))
+            self.filter_entries[name] = entry
+        
+        # Keystrokes only restart the debounce timer; filtering runs once typing pauses
+        for entry in [self.search_entry, *self.filter_entries.values()]:
+            entry.bind("<KeyRelease>", self.schedule_filter)
+        self._filter_job = None
+        self.filter_criteria = None
+        
         # Create a container for the transaction list
-        self.list_container = tk.Frame(self, bg="white")
+        self.list_container = themed(tk.Frame, self, bg="surface")
         self.list_container.pack(fill="both", expand=True, padx=20)
         
-        # Transaction history headers
-        headers_frame = tk.Frame(self.list_container, bg="#E75480")
-        headers_frame.pack(fill="x", pady=(0, 1))
-        
-        # Column configurations
+        # Column configurations (model sort column, width in pixels, anchor)
         self.columns = {
-            "DATE": {"width": 12, "anchor": "center"},
-            "AMOUNT": {"width": 12, "anchor": "center"},
-            "DESCRIPTION": {"width": 40, "anchor": "w"}  # Increased width for description
+            "DATE": {"sort": "date", "width": 80, "anchor": "center"},
+            "AMOUNT": {"sort": "amount", "width": 70, "anchor": "center"},
+            "BALANCE": {"sort": "balance", "width": 70, "anchor": "center"},
+            "DESCRIPTION": {"sort": "description", "width": 120, "anchor": "w"}
         }
         
-        # Create headers
-        for header, config in self.columns.items():
-            tk.Label(
-                headers_frame,
-                text=header,
-                font=("Arial", 10, "bold"),
-                bg="#E75480",
-                fg="white",
-                width=config["width"],
-                anchor=config["anchor"]
-            ).pack(side="left", padx=5, pady=5)
-        
-        # Create scrollable frame for transactions
-        self.transactions_canvas = tk.Canvas(
+        # One Treeview holds every row; items are inserted page by page as they scroll into view
+        self.table = ttk.Treeview(
             self.list_container,
-            bg="white",
-            highlightthickness=0
+            columns=list(self.columns),
+            show="headings",
+            selectmode="browse",
+            style="Account.Treeview"
         )
-        self.transactions_canvas.pack(side="left", fill="both", expand=True)
+        for header, config in self.columns.items():
+            self.table.heading(header, text=header, command=lambda h=header: self.sort_by(h))
+            self.table.column(
+                header,
+                width=config["width"],
+                anchor=config["anchor"],
+                stretch=header == "DESCRIPTION"
+            )
+        themed_tag(self.table, "income", foreground="accent")
+        themed_tag(self.table, "paid", foreground="muted")
+        self.table.pack(side="left", fill="both", expand=True)
         
         # Add scrollbar
-        scrollbar = tk.Scrollbar(
+        self.scrollbar = tk.Scrollbar(
             self.list_container,
             orient="vertical",
-            command=self.transactions_canvas.yview
-        )
-        scrollbar.pack(side="right", fill="y")
-        
-        # Configure canvas
-        self.transactions_canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Create frame for transaction rows
-        self.transactions_frame = tk.Frame(self.transactions_canvas, bg="white")
-        self.transactions_canvas.create_window(
-            (0, 0),
-            window=self.transactions_frame,
-            anchor="nw",
-            width=self.transactions_canvas.winfo_reqwidth()
+            command=self.table.yview
         )
-        
-        # Bind resize event
-        self.transactions_frame.bind("<Configure>", self.on_frame_configure)
-        self.transactions_canvas.bind("<Configure>", self.on_canvas_configure)
+        self.scrollbar.pack(side="right", fill="y")
+        self.table.configure(yscrollcommand=self.on_table_scroll)
+        
+        # Row actions: double-click or Return edits, Delete removes, right-click offers both
+        self.row_menu = tk.Menu(self, tearoff=0)
+        self.row_menu.add_command(label="Edit", command=lambda: self.edit_transaction(self.selected_id()))
+        self.row_menu.add_command(label="Delete", command=lambda: self.delete_transaction(self.selected_id()))
+        self.table.bind("<Double-1>", lambda e: self.edit_selected())
+        self.table.bind("<Return>", lambda e: self.edit_selected())
+        self.table.bind("<Delete>", lambda e: self.delete_selected())
+        self.table.bind("<Button-3>", self.show_row_menu)
+        
+        # Sort state and lazily filled rows
+        self.sort_column = "DATE"
+        self.sort_descending = True  # newest first
+        self._rows = ()
+        self._balances = {}  # (year, month) -> balances by id
+        self._filled = 0
+        self._fill_target = 0
     
-    def on_frame_configure(self, event=None):
-        """Reset the scroll region to encompass the inner frame"""
-        self.transactions_canvas.configure(scrollregion=self.transactions_canvas.bbox("all"))
+    def on_table_scroll(self, first, last):
+        """Keep the scrollbar in sync and load the next page near the bottom"""
+        self.scrollbar.set(first, last)
+        if float(last) >= 0.9 and self._fill_target <= self._filled < len(self._rows):
+            self._fill_target = self._filled + TABLE_PAGE_SIZE
+            if self._render_job is None:
+                self._render_rows()
     
-    def on_canvas_configure(self, event):
-        """When canvas is resized, resize the inner frame to match"""
-        self.transactions_canvas.itemconfig(
-            self.transactions_canvas.find_withtag("all")[0],
-            width=event.width
-        )
+    def selected_id(self):
+        selection = self.table.selection()
+        return int(selection[0]) if selection else None
+    
+    def edit_selected(self):
+        if self.selected_id() is not None:
+            self.edit_transaction(self.selected_id())
+    
+    def delete_selected(self):
+        if self.selected_id() is not None:
+            self.delete_transaction(self.selected_id())
+    
+    def show_row_menu(self, event):
+        row = self.table.identify_row(event.y)
+        if row:
+            self.table.selection_set(row)
+            self.row_menu.tk_popup(event.x_root, event.y_root)
+    
+    def schedule_filter(self, event=None):
+        """Restart the debounce timer for applying the filter bar"""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(FILTER_DEBOUNCE_MS, self.apply_filter)
+    
+    def apply_filter(self):
+        self._filter_job = None
+        criteria = self.read_filter()
+        if criteria != self.filter_criteria:
+            self.filter_criteria = criteria
+            self.refresh_list()
+    
+    def read_filter(self):
+        """
+        Criteria from the filter bar as filter_transactions arguments, or
+        None when the bar is empty. Fields that do not parse are ignored.
+        """
+        text = self.search_entry.get().strip()
+        category = None if self.category_var.get() == "All" else self.category_var.get()
+        amounts = []
+        for name in ("min", "max"):
+            is_valid, amount = validate_amount(self.filter_entries[name].get().strip())
+            amounts.append(amount if is_valid else None)
+        dates = []
+        for name in ("start", "end"):
+            try:
+                dates.append(datetime.strptime(self.filter_entries[name].get().strip(), "%Y-%m-%d"))
+            except ValueError:
+                dates.append(None)
+        if dates[1] is not None:
+            dates[1] += timedelta(days=1)  # the "To" date is inclusive
+        criteria = (text, category, *amounts, *dates)
+        return criteria if any(c not in (None, "") for c in criteria) else None
     
-    def show_entry_dialog(self):
+    def sort_by(self, header):
+        """Sort by a column, toggling the direction when it is already sorted by it"""
+        if header == self.sort_column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = header
+            self.sort_descending = header in ("DATE", "BALANCE")
+        # Headings are live while the ledger loads; the order applies once it is attached
+        if self.account_data is not None:
+            self.update_displays()
+    
+    def show_entry_dialog(self, transaction=None):
         # Hide the current account screen
         self.pack_forget()
         
         # Create and show the input screen
         input_screen = InputScreen(
+            self.parent,
+            self.account_data,
+            on_complete=self.on_input_complete,
+            on_back=self.on_input_back,
+            transaction=transaction
+        )
+    
+    def show_bulk_entry(self):
+        """Open the bulk entry sheet; its rows are saved as one batch"""
+        self.pack_forget()
+        BulkInputScreen(
             self.parent,
             self.account_data,
             on_complete=self.on_input_complete,
             on_back=self.on_input_back
         )
     
+    def edit_transaction(self, transaction_id):
+        """Open the input screen prefilled with an existing transaction"""
+        self.show_entry_dialog(self.account_data.get_transaction(transaction_id))
+    
+    def delete_transaction(self, transaction_id):
+        """Delete a transaction after confirmation"""
+        if messagebox.askyesno("Delete", "Delete this transaction?"):
+            self.account_data.delete_transaction(transaction_id)
+    
     def on_input_complete(self):
-        """Called when input is saved"""
-        self.update_displays()
+        """Called when input is saved; the model listener already refreshed the list"""
         self.pack(fill="both", expand=True)
     
     def on_input_back(self):
         """Called when back button is pressed"""
         self.pack(fill="both", expand=True)
     
+    def on_day_change(self):
+        """Update the date dependent header labels and the monthly list"""
+        self.date_label.config(text=self.account_data.today_date)
+        self.year_label.config(text=str(self.account_data.clock.year))
+        self.monthly_range_label.config(text=self.account_data.monthly_range)
+        self.chart.set_range((self.account_data.clock.year, 1))
+        self.heatmap.set_year(self.account_data.clock.year)
+        self.update_displays()
+    
+    def destroy(self):
+        """Stop listening to the model before destroying the widget"""
+        if self.account_data is not None:
+            self.account_data.remove_listener(self.update_displays)
+            self.account_data.clock.cancel_rollover(self._rollover)
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        super().destroy()
+    
+    @timed()
+    @profiled()
     def update_displays(self):
         self.saving_label.config(text=f"${self.account_data.total_saving:.2f}")
         self.income_label.config(text=f"${self.account_data.income:.2f}")
         self.paid_label.config(text=f"${self.account_data.paid:.2f}")
         self.monthly_amount_label.config(text=f"${self.account_data.monthly_total:.2f}")
+        self.chart.request_redraw()
+        self.heatmap.refresh()
+        self.refresh_list()
+    
+    @timed()
+    def refresh_list(self):
+        """Show this month's rows, or the filter results while the filter bar is in use"""
+        # Cancel a render still in progress from an earlier refresh
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+            self._render_job = None
         
         # Clear existing transactions
-        for widget in self.transactions_frame.winfo_children():
-            widget.destroy()
-        
-        # Add transactions
-        for transaction in reversed(self.account_data.monthly_transactions):
-            row = tk.Frame(self.transactions_frame, bg="white")
-            row.pack(fill="x", pady=1)
-            
-            # Date
-            tk.Label(
-                row,
-                text=transaction['date'].strftime("%Y-%m-%d"),
-                bg="white",
-                width=self.columns["DATE"]["width"],
-                anchor=self.columns["DATE"]["anchor"]
-            ).pack(side="left", padx=5)
-            
-            # Amount
-            sign = "+" if transaction['category'] == "Income" else "-"
-            amount_text = f"{sign}${transaction['amount']:.2f}"
-            tk.Label(
-                row,
-                text=amount_text,
-                bg="white",
-                width=self.columns["AMOUNT"]["width"],
-                anchor=self.columns["AMOUNT"]["anchor"],
-                fg="#E75480" if sign == "+" else "#666666"
-            ).pack(side="left", padx=5)
-            
-            # Description (with word wrap)
-            description_label = tk.Label(
-                row,
-                text=transaction['description'],
-                bg="white",
-                anchor=self.columns["DESCRIPTION"]["anchor"],
-                justify="left",
-                wraplength=150  # Adjust this value based on your needs
-            )
-            description_label.pack(side="left", padx=5, fill="x", expand=True)
-        
-        # Update scroll region
-        self.on_frame_configure()
\ No newline at end of file
+        self.table.delete(*self.table.get_children())
+        
+        # Rows come pre-sorted from the model; only the first page is inserted now
+        column = self.columns[self.sort_column]["sort"]
+        if self.filter_criteria:
+            rows = self.account_data.filter_transactions(*self.filter_criteria)
+            rows = self.account_data.sort_rows(rows, column)
+        else:
+            rows = self.account_data.sorted_transactions(*self.account_data.clock.month_key, column)
+        self._rows = rows[::-1] if self.sort_descending else rows
+        self._balances = {}
+        self._filled = 0
+        self._fill_target = TABLE_PAGE_SIZE
+        self._render_rows()
+    
+    def _render_rows(self):
+        """Insert rows up to the fill target, yielding to Tk when the time slice is used up"""
+        deadline = time.perf_counter() + RENDER_SLICE_MS / 1000
+        self._render_job = None
+        while self._filled < min(self._fill_target, len(self._rows)):
+            self._add_row(self._rows[self._filled], self._balance(self._rows[self._filled]))
+            self._filled += 1
+            if time.perf_counter() >= deadline:
+                self._render_job = self.after(1, self._render_rows)
+                break
+    
+    def _balance(self, transaction):
+        """Running balance of a row, fetching balances one month at a time"""
+        key = month_key(transaction['date'])
+        if key not in self._balances:
+            self._balances[key] = self.account_data.month_balances(*key)
+        return self._balances[key][transaction['id']]
+    
+    def _add_row(self, transaction, balance):
+        sign = "+" if transaction['category'] == "Income" else "-"
+        self.table.insert(
+            "",
+            "end",
+            iid=str(transaction['id']),
+            values=(
+                transaction['date'].strftime("%Y-%m-%d"),
+                f"{sign}${transaction['amount']:.2f}",
+                f"${balance:.2f}",
+                transaction['description']
+            ),
+            tags=("income" if sign == "+" else "paid",)
+        )
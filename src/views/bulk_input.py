@@ -0,0 +1,230 @@
+"""
+Spreadsheet-style screen for entering many transactions at once.
+"""
+import tkinter as tk
+from tkinter import ttk
+from datetime import datetime
+from src.utils.validation import validate_amount
+from src.utils.theme import FONTS, themed, themed_config
+from src.utils.instrumentation import timed
+
+BULK_ROWS = 10  # rows shown initially; more are added as the last one fills up
+
+
+class BulkInputScreen(tk.Frame):
+    """
+    Grid of date/amount/category/description rows.
+    Tab moves to the next cell, Enter and the arrow keys move between rows,
+    and each cell is validated when it loses focus. SAVE adds every filled
+    row through AccountData.add_transactions, so the model notifies (and
+    the account screen refreshes) once for the whole sheet.
+    """
+    COLUMNS = ("DATE", "AMOUNT", "CATEGORY", "DESCRIPTION")
+
+    def __init__(self, parent, account_data, on_complete=None, on_back=None):
+        super().__init__(parent)
+        self.parent = parent
+        self.account_data = account_data
+        self.on_complete = on_complete
+        self.on_back = on_back
+        self.rows = []  # one dict of cell widgets per row
+        
+        self.setup_ui()
+        self.pack(fill="both", expand=True)
+        self.rows[0]["AMOUNT"].focus_set()
+
+    def setup_ui(self):
+        """Setup the user interface components"""
+        themed_config(self, bg="form")
+        
+        # Header with back button and title
+        header_frame = themed(tk.Frame, self, bg="form")
+        header_frame.pack(fill="x", padx=20, pady=20)
+        
+        themed(tk.Button,
+            header_frame,
+            text="←",
+            font=FONTS["icon"],
+            bg="form",
+            fg="accent",
+            bd=0,
+            command=self.return_to_account,
+            cursor="hand2"
+        ).pack(side="left")
+        
+        themed(tk.Label,
+            header_frame,
+            text="Bulk Input",
+            font=FONTS["heading"],
+            bg="form",
+            fg="accent"
+        ).pack(side="left", padx=20)
+        
+        # Save button and status line at the bottom
+        themed(tk.Button,
+            self,
+            text="SAVE",
+            command=self.save_transactions,
+            bg="accent",
+            fg="on_accent",
+            font=FONTS["label"],
+            bd=0,
+            pady=10,
+            cursor="hand2"
+        ).pack(side="bottom", fill="x", padx=20, pady=20)
+        
+        self.status_label = themed(tk.Label,
+            self,
+            text="Tab: next cell · Enter: next row · I/P: category",
+            font=FONTS["small"],
+            bg="form",
+            fg="muted"
+        )
+        self.status_label.pack(side="bottom")
+        
+        # Scrollable grid
+        grid_container = themed(tk.Frame, self, bg="accent")
+        grid_container.pack(fill="both", expand=True, padx=20)
+        
+        self.canvas = themed(tk.Canvas, grid_container, bg="surface", highlightthickness=0)
+        scrollbar = ttk.Scrollbar(grid_container, orient="vertical", command=self.canvas.yview)
+        self.grid_frame = themed(tk.Frame, self.canvas, bg="surface")
+        self.grid_frame.bind(
+            "<Configure>",
+            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        )
+        self.canvas.create_window((0, 0), window=self.grid_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        for column, text in enumerate(self.COLUMNS):
+            themed(tk.Label,
+                self.grid_frame,
+                text=text,
+                font=FONTS["small_bold"],
+                bg="accent",
+                fg="on_accent"
+            ).grid(row=0, column=column, sticky="ew")
+        self.grid_frame.columnconfigure(3, weight=1)
+        
+        for _ in range(BULK_ROWS):
+            self.add_row()
+
+    def add_row(self):
+        """Append an empty row; its date defaults to the previous row's"""
+        row = len(self.rows) + 1  # grid row 0 holds the headers
+        previous = self.rows[-1]["DATE"].get() if self.rows else \
+            self.account_data.clock.today.strftime("%Y-%m-%d")
+        cells = {
+            "DATE": themed(tk.Entry, self.grid_frame, font=FONTS["cell"], bg="field", fg="text", bd=0, width=11),
+            "AMOUNT": themed(tk.Entry, self.grid_frame, font=FONTS["cell"], bg="field", fg="text", bd=0, width=9),
+            "CATEGORY": ttk.Combobox(self.grid_frame, values=("Paid", "Income"),
+                                     state="readonly", width=7),
+            "DESCRIPTION": themed(tk.Entry, self.grid_frame, font=FONTS["cell"], bg="field", fg="text", bd=0),
+        }
+        cells["DATE"].insert(0, previous)
+        cells["CATEGORY"].set("Paid")
+        cells["CATEGORY"].bind("<Key-i>", lambda e: cells["CATEGORY"].set("Income"))
+        cells["CATEGORY"].bind("<Key-p>", lambda e: cells["CATEGORY"].set("Paid"))
+        
+        index = len(self.rows)
+        for column, name in enumerate(self.COLUMNS):
+            cell = cells[name]
+            cell.grid(row=row, column=column, sticky="ew", padx=1, pady=1)
+            cell.bind("<Return>", lambda e, c=name: self.move(index, c, 1))
+            cell.bind("<Down>", lambda e, c=name: self.move(index, c, 1))
+            cell.bind("<Up>", lambda e, c=name: self.move(index, c, -1))
+            if name != "CATEGORY":
+                cell.bind("<FocusOut>", lambda e, c=name: self.check_row(index, [c]))
+        self.rows.append(cells)
+        return cells
+
+    def move(self, index, column, step):
+        """Focus the same column step rows away, adding a row past the end"""
+        self.check_row(index)
+        target = index + step
+        if target < 0:
+            return "break"
+        if target >= len(self.rows):
+            self.add_row()
+        cell = self.rows[target][column]
+        cell.focus_set()
+        self.canvas.update_idletasks()
+        self.canvas.yview_moveto(max(0, target - 3) / len(self.rows))
+        return "break"
+
+    def is_blank(self, cells):
+        return not (cells["AMOUNT"].get().strip() or cells["DESCRIPTION"].get().strip())
+
+    def parse_row(self, cells):
+        """
+        Parse a row into add_transaction keyword arguments.
+        Returns (fields, errors) where errors maps column names to messages.
+        """
+        errors = {}
+        is_valid, amount = validate_amount(cells["AMOUNT"].get().strip())
+        if not is_valid:
+            errors["AMOUNT"] = amount
+        try:
+            transaction_date = datetime.strptime(cells["DATE"].get().strip(), "%Y-%m-%d")
+        except ValueError:
+            errors["DATE"] = "Invalid date format (YYYY-MM-DD)"
+        description = cells["DESCRIPTION"].get().strip()
+        if not description:
+            errors["DESCRIPTION"] = "Description is required"
+        if errors:
+            return None, errors
+        return {
+            'amount': amount,
+            'category': cells["CATEGORY"].get(),
+            'description': description,
+            'date': transaction_date
+        }, errors
+
+    def check_row(self, index, columns=("DATE", "AMOUNT", "DESCRIPTION")):
+        """
+        Highlight the invalid cells among columns of a row and return their
+        errors. Blank rows are never invalid.
+        """
+        cells = self.rows[index]
+        errors = {} if self.is_blank(cells) else self.parse_row(cells)[1]
+        errors = {name: message for name, message in errors.items() if name in columns}
+        for name in columns:
+            themed_config(cells[name], bg="invalid" if name in errors else "field")
+        if errors:
+            themed_config(self.status_label, text=f"Row {index + 1}: {next(iter(errors.values()))}", fg="accent")
+        else:
+            themed_config(self.status_label, fg="muted")
+        return errors
+
+    @timed()
+    def save_transactions(self):
+        """Validate every filled row and add them all as one batch"""
+        transactions = []
+        for index, cells in enumerate(self.rows):
+            if self.is_blank(cells):
+                continue
+            errors = self.check_row(index)
+            if errors:
+                cells[next(iter(errors))].focus_set()
+                return
+            transactions.append(self.parse_row(cells)[0])
+        
+        if not transactions:
+            themed_config(self.status_label, text="Nothing to save", fg="accent")
+            return
+        
+        self.account_data.add_transactions(transactions)
+        
+        self.pack_forget()
+        self.destroy()
+        if self.on_complete:
+            self.on_complete()
+
+    def return_to_account(self):
+        """Return to account book page"""
+        self.pack_forget()
+        self.destroy()
+        if self.on_back:
+            self.on_back()
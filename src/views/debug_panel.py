@@ -0,0 +1,52 @@
+"""
+Debug panel with memory and timing reports.
+"""
+import tkinter as tk
+from src.models.memory import format_report
+from src.utils.profiling import registry
+from src.utils.theme import FONTS, themed, themed_config
+
+
+class DebugPanel(tk.Toplevel):
+    """
+    Window showing AccountData.memory_report() and the profiling registry.
+    Opened with a hidden hotkey; Refresh recomputes both reports.
+    """
+
+    def __init__(self, parent, account_data):
+        super().__init__(parent)
+        self.account_data = account_data
+        self.title("Debug")
+        themed_config(self, bg="surface")
+        
+        self.text = themed(tk.Text,
+            self,
+            font="TkFixedFont",
+            bg="surface",
+            fg="text",
+            bd=0,
+            width=80,
+            height=30
+        )
+        self.text.pack(fill="both", expand=True, padx=10, pady=(10, 0))
+        
+        themed(tk.Button,
+            self,
+            text="Refresh",
+            command=self.refresh,
+            bg="accent",
+            fg="on_accent",
+            font=FONTS["small_bold"],
+            bd=0,
+            cursor="hand2"
+        ).pack(fill="x", padx=10, pady=10)
+        
+        self.refresh()
+
+    def refresh(self):
+        lines = ["Memory"] + format_report(self.account_data.memory_report())
+        lines += ["", "Timings", registry.report()]
+        self.text.config(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.insert("1.0", "\n".join(lines))
+        self.text.config(state="disabled")
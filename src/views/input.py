@@ -12,15 +12,19 @@ from src.constants import (
     DARK_TEXT
 )
 from src.utils.validation import validate_amount
+from src.utils.theme import FONTS, themed, themed_config
+from src.utils.instrumentation import timed
+from src.utils.profiling import profiled
 from src.components.toggle_button import ToggleButton
 
 class InputScreen(tk.Frame):
-    def __init__(self, parent, account_data, on_complete=None, on_back=None):
+    def __init__(self, parent, account_data, on_complete=None, on_back=None, transaction=None):
         super().__init__(parent)
         self.parent = parent
         self.account_data = account_data
         self.on_complete = on_complete
         self.on_back = on_back
+        self.transaction = transaction  # Existing record when editing
         
         # Initialize UI
         self.setup_ui()
@@ -29,34 +33,34 @@ class InputScreen(tk.Frame):
     def setup_ui(self):
         """Setup the user interface components"""
         # Create gradient background (yellow to pink)
-        self.configure(bg="#FFE5E5")
+        themed_config(self, bg="form")
         
         # Header with back button and title
-        header_frame = tk.Frame(self, bg="#FFE5E5")
+        header_frame = themed(tk.Frame, self, bg="form")
         header_frame.pack(fill="x", padx=20, pady=20)
         
-        back_button = tk.Button(
+        back_button = themed(tk.Button,
             header_frame,
             text="←",
-            font=("Arial", 24),
-            bg="#FFE5E5",
-            fg="#E75480",
+            font=FONTS["icon"],
+            bg="form",
+            fg="accent",
             bd=0,
             command=self.return_to_account,
             cursor="hand2"
         )
         back_button.pack(side="left")
         
-        tk.Label(
+        themed(tk.Label,
             header_frame,
-            text="Input",
-            font=("Arial", 24, "bold"),
-            bg="#FFE5E5",
-            fg="#E75480"
+            text="Edit" if self.transaction else "Input",
+            font=FONTS["heading"],
+            bg="form",
+            fg="accent"
         ).pack(side="left", padx=20)
         
         # Transaction type toggle
-        type_frame = tk.Frame(self, bg="white", bd=0)
+        type_frame = themed(tk.Frame, self, bg="surface", bd=0)
         type_frame.pack(fill="x", padx=20, pady=10)
         
         self.transaction_type = tk.StringVar(value="Income")
@@ -78,84 +82,94 @@ class InputScreen(tk.Frame):
         )
         self.income_button.pack(side="right", expand=True)
         
+        if self.transaction:
+            self.transaction_type.set(self.transaction['category'])
+        
         # Date input
-        date_frame = tk.Frame(self, bg="#E75480", bd=0)
+        date_frame = themed(tk.Frame, self, bg="accent", bd=0)
         date_frame.pack(fill="x", padx=20, pady=10)
         
-        tk.Label(
+        themed(tk.Label,
             date_frame,
             text="DATE",
-            font=("Arial", 14, "bold"),
-            bg="#E75480",
-            fg="white"
+            font=FONTS["label"],
+            bg="accent",
+            fg="on_accent"
         ).pack(side="left", padx=20, pady=15)
         
-        self.date_entry = tk.Entry(
+        self.date_entry = themed(tk.Entry,
             date_frame,
-            font=("Arial", 14),
-            bg="#FFE4E1",
-            fg="#666666",
+            font=FONTS["field"],
+            bg="field",
+            fg="muted",
             bd=0
         )
         self.date_entry.pack(side="right", padx=20, pady=15, fill="x", expand=True)
-        self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        initial_date = self.transaction['date'] if self.transaction else self.account_data.clock.today
+        self.date_entry.insert(0, initial_date.strftime("%Y-%m-%d"))
         
         # Amount input
-        amount_frame = tk.Frame(self, bg="#E75480", bd=0)
+        amount_frame = themed(tk.Frame, self, bg="accent", bd=0)
         amount_frame.pack(fill="x", padx=20, pady=10)
         
-        tk.Label(
+        themed(tk.Label,
             amount_frame,
             text="AMOUNT",
-            font=("Arial", 14, "bold"),
-            bg="#E75480",
-            fg="white"
+            font=FONTS["label"],
+            bg="accent",
+            fg="on_accent"
         ).pack(side="left", padx=20, pady=15)
         
-        self.amount_entry = tk.Entry(
+        self.amount_entry = themed(tk.Entry,
             amount_frame,
-            font=("Arial", 14),
-            bg="#FFE4E1",
-            fg="#666666",
+            font=FONTS["field"],
+            bg="field",
+            fg="muted",
             bd=0
         )
         self.amount_entry.pack(side="right", padx=20, pady=15, fill="x", expand=True)
+        if self.transaction:
+            self.amount_entry.insert(0, f"{self.transaction['amount']:.2f}")
         
         # Description input
-        description_frame = tk.Frame(self, bg="#E75480", bd=0)
+        description_frame = themed(tk.Frame, self, bg="accent", bd=0)
         description_frame.pack(fill="x", padx=20, pady=10)
         
-        tk.Label(
+        themed(tk.Label,
             description_frame,
             text="DESCRIPTION",
-            font=("Arial", 14, "bold"),
-            bg="#E75480",
-            fg="white"
+            font=FONTS["label"],
+            bg="accent",
+            fg="on_accent"
         ).pack(anchor="w", padx=20, pady=(15, 5))
         
-        self.description_text = tk.Text(
+        self.description_text = themed(tk.Text,
             description_frame,
-            font=("Arial", 14),
-            bg="#FFE4E1",
-            fg="#666666",
+            font=FONTS["field"],
+            bg="field",
+            fg="muted",
             bd=0,
             height=8
         )
         self.description_text.pack(padx=20, pady=(5, 15), fill="both")
+        if self.transaction:
+            self.description_text.insert("1.0", self.transaction['description'])
         
         # Save button at the bottom
-        tk.Button(
+        themed(tk.Button,
             self,
             text="SAVE",
             command=self.save_transaction,
-            bg="#E75480",
-            fg="white",
-            font=("Arial", 14, "bold"),
+            bg="accent",
+            fg="on_accent",
+            font=FONTS["label"],
             bd=0,
             pady=10,
             cursor="hand2"
         ).pack(side="bottom", fill="x", padx=20, pady=20)
     
+    @timed()
+    @profiled()
     def save_transaction(self):
         """Save the transaction and close the window"""
         # Validate amount
@@ -180,13 +194,27 @@ class InputScreen(tk.Frame):
             messagebox.showerror("Error", "Invalid date format (YYYY-MM-DD)")
             return
         
-        # Add transaction
-        self.account_data.add_transaction(
-            amount=amount,
-            category=self.transaction_type.get(),
-            description=description,
-            date=transaction_date
-        )
+        # Add or update transaction
+        if self.transaction:
+            try:
+                self.account_data.update_transaction(
+                    self.transaction['id'],
+                    amount=amount,
+                    category=self.transaction_type.get(),
+                    description=description,
+                    date=transaction_date
+                )
+            except KeyError:
+                # The record was removed (e.g. undone) while this screen was open
+                messagebox.showerror("Error", "This transaction no longer exists")
+                return
+        else:
+            self.account_data.add_transaction(
+                amount=amount,
+                category=self.transaction_type.get(),
+                description=description,
+                date=transaction_date
+            )
         
         # Destroy this screen and trigger callback
         self.pack_forget()
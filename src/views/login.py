@@ -7,6 +7,7 @@ import os
 from PIL import Image, ImageTk
 from src.constants import PINK_BUTTON, LIGHT_CREAM
 from src.utils.auth import validate_credentials
+from src.utils.theme import FONTS, themed, themed_config
 
 class LoginScreen(tk.Frame):
     def __init__(self, parent, credentials):
@@ -15,12 +16,12 @@ class LoginScreen(tk.Frame):
         self.credentials = credentials
         self.login_success_callback = None
         
-        self.configure(bg="#FFB6C1")
+        themed_config(self, bg="background")
         self.pack(fill="both", expand=True)
         
-        self.login_container = tk.Frame(
+        self.login_container = themed(tk.Frame,
             self,
-            bg="white",
+            bg="surface",
             highlightthickness=0
         )
         self.login_container.place(relx=0.5, rely=0.5, anchor="center")
@@ -29,46 +30,48 @@ class LoginScreen(tk.Frame):
     
     def create_widgets(self):
         # Title
-        title = tk.Label(
+        title = themed(tk.Label,
             self.login_container,
             text="webabiq",
-            font=("Arial", 24, "bold"),
-            bg="white",
-            fg="#E75480"
+            font=FONTS["heading"],
+            bg="surface",
+            fg="accent"
         )
         title.pack(pady=(20, 30))
         
         # Username
-        tk.Label(
+        themed(tk.Label,
             self.login_container,
             text="USERNAME",
-            font=("Arial", 12),
-            bg="white",
-            fg="#E75480"
+            font=FONTS["body"],
+            bg="surface",
+            fg="accent"
         ).pack(anchor="w", padx=20)
         
-        self.username_entry = tk.Entry(
+        self.username_entry = themed(tk.Entry,
             self.login_container,
-            font=("Arial", 12),
-            bg="#FFE4E1",
+            font=FONTS["body"],
+            bg="field",
+            fg="text",
             relief="flat",
             width=30
         )
         self.username_entry.pack(padx=20, pady=(0, 20), ipady=8)
         
         # Password
-        tk.Label(
+        themed(tk.Label,
             self.login_container,
             text="PASSWORD",
-            font=("Arial", 12),
-            bg="white",
-            fg="#E75480"
+            font=FONTS["body"],
+            bg="surface",
+            fg="accent"
         ).pack(anchor="w", padx=20)
         
-        self.password_entry = tk.Entry(
+        self.password_entry = themed(tk.Entry,
             self.login_container,
-            font=("Arial", 12),
-            bg="#FFE4E1",
+            font=FONTS["body"],
+            bg="field",
+            fg="text",
             relief="flat",
             width=30,
             show="•"
@@ -80,13 +83,13 @@ class LoginScreen(tk.Frame):
         self.username_entry.bind('<Return>', lambda e: self.password_entry.focus())
         
         # Login button
-        tk.Button(
+        themed(tk.Button,
             self.login_container,
             text="LOG IN",
             command=self.login,
-            bg="#E75480",
-            fg="white",
-            font=("Arial", 12, "bold"),
+            bg="accent",
+            fg="on_accent",
+            font=FONTS["body_bold"],
             relief="flat",
             width=25,
             cursor="hand2"
@@ -106,10 +109,10 @@ class LoginScreen(tk.Frame):
                 image = image.resize((50, 50), Image.Resampling.LANCZOS)
                 photo = ImageTk.PhotoImage(image)
                 
-                logo_label = tk.Label(
+                logo_label = themed(tk.Label,
                     self,
                     image=photo,
-                    bg="#FFB6C1"
+                    bg="background"
                 )
                 logo_label.image = photo
                 logo_label.pack(side="bottom", pady=20)
@@ -124,7 +127,7 @@ class LoginScreen(tk.Frame):
         
         if is_valid:
             if self.login_success_callback:
-                self.login_success_callback()
+                self.login_success_callback(username)
         else:
             messagebox.showerror("Error", error_message)
     
@@ -7,6 +7,9 @@ import os
 import threading
 import cv2
 from PIL import Image, ImageTk
+from src.utils.theme import FONTS, themed, themed_config
+from src.utils.instrumentation import span
+from src.utils.profiling import profiled
 
 class SplashScreen(tk.Frame):
     def __init__(self, parent):
@@ -15,7 +18,7 @@ class SplashScreen(tk.Frame):
         self.is_playing = False
         
         # Configure pink background
-        self.configure(bg="#FFB6C1")
+        themed_config(self, bg="background")
         self.pack(fill="both", expand=True)
         
         # Create assets directory if it doesn't exist
@@ -30,7 +33,7 @@ class SplashScreen(tk.Frame):
         if os.path.exists(self.video_path):
             try:
                 # Create a label to display video frames
-                self.video_label = tk.Label(self, bg="#FFB6C1")
+                self.video_label = themed(tk.Label, self, bg="background")
                 self.video_label.pack(expand=True)
                 
                 # Start video playback in a separate thread
@@ -46,33 +49,35 @@ class SplashScreen(tk.Frame):
             print(f"Video file not found at: {self.video_path}")
             self.show_fallback_text()
     
+    @profiled()
     def play_video(self):
         """Play the video file"""
         try:
             cap = cv2.VideoCapture(self.video_path)
             
             while self.is_playing:
-                ret, frame = cap.read()
-                if not ret:
-                    # Reset to beginning of video when it ends
-                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                    continue
-                
-                # Convert frame from BGR to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # Convert to PIL Image
-                image = Image.fromarray(frame_rgb)
-                
-                # Resize image to fit the window
-                image = self.resize_image(image, (self.winfo_width(), self.winfo_height()))
-                
-                # Convert to PhotoImage
-                photo = ImageTk.PhotoImage(image=image)
-                
-                # Update label with new frame
-                self.video_label.configure(image=photo)
-                self.video_label.image = photo
+                with span("SplashScreen.frame"):
+                    ret, frame = cap.read()
+                    if not ret:
+                        # Reset to beginning of video when it ends
+                        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                        continue
+                    
+                    # Convert frame from BGR to RGB
+                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    
+                    # Convert to PIL Image
+                    image = Image.fromarray(frame_rgb)
+                    
+                    # Resize image to fit the window
+                    image = self.resize_image(image, (self.winfo_width(), self.winfo_height()))
+                    
+                    # Convert to PhotoImage
+                    photo = ImageTk.PhotoImage(image=image)
+                    
+                    # Update label with new frame
+                    self.video_label.configure(image=photo)
+                    self.video_label.image = photo
                 
                 # Control frame rate
                 cv2.waitKey(33)  # approximately 30 fps
@@ -104,12 +109,12 @@ class SplashScreen(tk.Frame):
         for widget in self.winfo_children():
             widget.destroy()
             
-        label = tk.Label(
+        label = themed(tk.Label,
             self,
             text="webabiq",
-            font=("Arial", 24, "bold"),
-            bg="#FFB6C1",
-            fg="#FF69B4"
+            font=FONTS["heading"],
+            bg="background",
+            fg="splash"
         )
         label.pack(expand=True)
     